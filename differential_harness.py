@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Differential Grammar Testing Harness
+Run one corpus through several grammar variants / parser engines and report disagreements
+
+Each engine runs the whole corpus in its own worker process. The harness then compares
+accept/reject verdicts input by input and reports per-engine throughput, so a faster
+engine or a new grammar revision can be adopted knowing exactly where behavior changes.
+
+Every engine is fed by the PDF lexer. A grammar that uses terminals the lexer never produces
+(Corrected's single DIVISAO, Exceptional's MEM and ELSE) rejects every input that needs them,
+so such engines are left out of the default run and refused unless explicitly allowed.
+
+Usage:
+    python differential_harness.py                          # 500 generated inputs, all engines
+    python differential_harness.py --corpus teste2.txt      # real corpus (one expression per line)
+    python differential_harness.py --generate 5000 --seed 7 --engines updated,corrected --allow-unknown-terminals
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Callable
+
+from ll1_core import PDFCompliantLexer, LL1Parser, TokenType, PDF_COMPLIANT_GRAMMAR
+from grammar_loader import load_grammar_from_markdown
+from table_stats import CompressedTableParser
+
+SPEC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# The Exceptional analysis names its terminals differently from the PDF lexer
+EXCEPTIONAL_TERMINAL_ALIASES = {
+    'LPAREN': 'ABRE_PARENTESES',
+    'RPAREN': 'FECHA_PARENTESES',
+    'NUMBER': 'NUMERO_REAL',
+    'IDENTIFIER': 'VARIAVEL',
+    'IF': 'IFELSE',
+    'PLUS': 'SOMA',
+    'MINUS': 'SUBTRACAO',
+    'MULT': 'MULTIPLICACAO',
+    'DIV_REAL': 'DIVISAO_REAL',
+    'DIV_INT': 'DIVISAO_INTEIRA',
+    'MOD': 'RESTO',
+    'POW': 'POTENCIA',
+    'GT': 'MAIOR',
+    'LT': 'MENOR',
+    'EQ': 'IGUAL',
+    'NEQ': 'DIFERENTE',
+    'GTE': 'MAIOR_IGUAL',
+    'LTE': 'MENOR_IGUAL',
+}
+
+# Grammar variants: name -> (spec file, terminal aliases)
+GRAMMAR_VARIANTS = {
+    'updated': ('Updated_LL1_Grammar_PDF_Compliant.md', None),
+    'corrected': ('Corrected_LL1_Grammar_Documentation.md', None),
+    'exceptional': ('Exceptional_LL1_Grammar_Analysis.md', EXCEPTIONAL_TERMINAL_ALIASES),
+}
+
+
+def _variant_factory(name: str) -> Callable[[], LL1Parser]:
+    path, aliases = GRAMMAR_VARIANTS[name]
+    return lambda: LL1Parser.from_spec(os.path.join(SPEC_DIR, path), aliases)
+
+
+def engine_grammar(name: str) -> Dict[str, List[List[str]]]:
+    """Grammar an engine parses with; the built-in engines share PDF_COMPLIANT_GRAMMAR"""
+    if name in GRAMMAR_VARIANTS:
+        path, aliases = GRAMMAR_VARIANTS[name]
+        return load_grammar_from_markdown(os.path.join(SPEC_DIR, path), aliases)
+    return PDF_COMPLIANT_GRAMMAR
+
+
+def unknown_terminals(grammar: Dict[str, List[List[str]]]) -> List[str]:
+    """Terminals of grammar that the PDF lexer never produces"""
+    lexer_terminals = {token_type.value for token_type in TokenType}
+    return sorted({symbol for productions in grammar.values() for production in productions for symbol in production
+                   if symbol not in grammar and symbol != 'EPSILON' and symbol not in lexer_terminals})
+
+
+# Engine name -> factory returning an object with parse(tokens) -> (success, derivation, message)
+ENGINES: Dict[str, Callable[[], object]] = {'builtin': LL1Parser, 'compressed': CompressedTableParser}
+ENGINES.update({name: _variant_factory(name) for name in GRAMMAR_VARIANTS})
+
+
+@dataclass
+class EngineStats:
+    name: str
+    verdicts: List[bool]
+    tokens: int
+    seconds: float
+
+    @property
+    def accepted(self) -> int:
+        return sum(self.verdicts)
+
+    @property
+    def inputs_per_second(self) -> float:
+        return len(self.verdicts) / self.seconds if self.seconds > 0 else float('inf')
+
+    @property
+    def tokens_per_second(self) -> float:
+        return self.tokens / self.seconds if self.seconds > 0 else float('inf')
+
+
+@dataclass
+class Disagreement:
+    index: int
+    expression: str
+    verdicts: Dict[str, bool]
+
+
+@dataclass
+class DifferentialReport:
+    corpus_size: int
+    engines: List[EngineStats]
+    disagreements: List[Disagreement] = field(default_factory=list)
+    unknown_terminals: Dict[str, List[str]] = field(default_factory=dict)
+
+
+def _run_engine(name: str, corpus: List[str]) -> EngineStats:
+    """Worker: tokenize the corpus, then time only the parse of every input"""
+    engine = ENGINES[name]()
+    lexer = PDFCompliantLexer()
+
+    tokenized: List[Optional[list]] = []
+    for expression in corpus:
+        try:
+            tokenized.append(lexer.tokenize(expression))
+        except SyntaxError:
+            tokenized.append(None)
+
+    verdicts = []
+    token_count = 0
+    start = time.perf_counter()
+    for tokens in tokenized:
+        if tokens is None:
+            verdicts.append(False)
+            continue
+        token_count += len(tokens)
+        verdicts.append(engine.parse(tokens)[0])
+    seconds = time.perf_counter() - start
+
+    return EngineStats(name, verdicts, token_count, seconds)
+
+
+def run_differential(corpus: List[str], engine_names: List[str], workers: Optional[int] = None,
+                     allow_unknown_terminals: bool = False) -> DifferentialReport:
+    """
+    Run every engine over the corpus in parallel and collect accept/reject disagreements
+    Engines whose grammar uses terminals the lexer never produces raise ValueError unless
+    allow_unknown_terminals is set; their disagreements are then partly lexer artifacts
+    """
+    unknown = [name for name in engine_names if name not in ENGINES]
+    if unknown:
+        raise ValueError(f"Unknown engine(s): {', '.join(unknown)}. Available: {', '.join(ENGINES)}")
+    mismatched = {}
+    for name in engine_names:
+        terminals = unknown_terminals(engine_grammar(name))
+        if terminals:
+            mismatched[name] = terminals
+    if mismatched and not allow_unknown_terminals:
+        listed = '; '.join(f"{name} ({', '.join(terminals)})" for name, terminals in mismatched.items())
+        raise ValueError(f"Engine(s) use terminals the PDF lexer never produces: {listed}. "
+                         f"Their disagreements would not reflect grammar behavior (--allow-unknown-terminals runs them anyway)")
+
+    with ProcessPoolExecutor(max_workers=workers or len(engine_names)) as pool:
+        futures = [pool.submit(_run_engine, name, corpus) for name in engine_names]
+        stats = [future.result() for future in futures]
+
+    report = DifferentialReport(len(corpus), stats, unknown_terminals=mismatched)
+    for index, expression in enumerate(corpus):
+        verdicts = {s.name: s.verdicts[index] for s in stats}
+        if len(set(verdicts.values())) > 1:
+            report.disagreements.append(Disagreement(index, expression, verdicts))
+    return report
+
+
+class CorpusGenerator:
+    """Random sentence generator over a grammar, with optional token-level mutations"""
+
+    def __init__(self, grammar: Dict[str, List[List[str]]] = PDF_COMPLIANT_GRAMMAR, seed: Optional[int] = None,
+                 max_depth: int = 8):
+        self.grammar = grammar
+        self.random = random.Random(seed)
+        self.max_depth = max_depth
+        self.min_heights = self._calculate_min_heights()
+
+        # One lexeme per terminal, taken from the lexer's own mapping
+        self.lexemes: Dict[str, str] = {}
+        for text, token_type in PDFCompliantLexer().token_mapping.items():
+            self.lexemes.setdefault(token_type.value, text)
+        self.variables = ['A', 'B', 'C', 'X', 'Y', 'VAR', 'TEMP', 'RESULT']
+
+    def _calculate_min_heights(self) -> Dict[str, int]:
+        """Minimum derivation height per non-terminal (fixed point), used to terminate deep derivations"""
+        heights = {non_terminal: float('inf') for non_terminal in self.grammar}
+        changed = True
+        while changed:
+            changed = False
+            for non_terminal, productions in self.grammar.items():
+                for production in productions:
+                    height = 1 + max((heights.get(symbol, 0) for symbol in production), default=0)
+                    if height < heights[non_terminal]:
+                        heights[non_terminal] = height
+                        changed = True
+        return heights
+
+    def _production_height(self, production: List[str]) -> float:
+        return max((self.min_heights.get(symbol, 0) for symbol in production), default=0)
+
+    def _expand(self, symbol: str, depth: int, out: List[str]):
+        if symbol == 'EPSILON':
+            return
+        if symbol not in self.grammar:
+            out.append(self._lexeme(symbol))
+            return
+        productions = self.grammar[symbol]
+        if depth >= self.max_depth:
+            shortest = min(self._production_height(p) for p in productions)
+            productions = [p for p in productions if self._production_height(p) == shortest]
+        for child in self.random.choice(productions):
+            self._expand(child, depth + 1, out)
+
+    def _lexeme(self, terminal: str) -> str:
+        if terminal == TokenType.NUMERO_REAL.value:
+            return self.random.choice([str(self.random.randint(0, 99)), f"{self.random.uniform(0, 99):.1f}"])
+        if terminal == TokenType.VARIAVEL.value:
+            return self.random.choice(self.variables)
+        return self.lexemes.get(terminal, terminal)
+
+    def sentence(self) -> List[str]:
+        out: List[str] = []
+        self._expand(next(iter(self.grammar)), 0, out)
+        return out
+
+    def mutate(self, lexemes: List[str]) -> List[str]:
+        """Delete, duplicate or swap one token so the corpus also exercises rejects"""
+        lexemes = list(lexemes)
+        i = self.random.randrange(len(lexemes))
+        action = self.random.choice(('delete', 'duplicate', 'swap'))
+        if action == 'delete' and len(lexemes) > 1:
+            del lexemes[i]
+        elif action == 'swap' and i + 1 < len(lexemes):
+            lexemes[i], lexemes[i + 1] = lexemes[i + 1], lexemes[i]
+        else:
+            lexemes.insert(i, lexemes[i])
+        return lexemes
+
+    def generate(self, count: int, mutation_rate: float = 0.5) -> List[str]:
+        corpus = []
+        for _ in range(count):
+            lexemes = self.sentence()
+            if self.random.random() < mutation_rate:
+                lexemes = self.mutate(lexemes)
+            corpus.append(' '.join(lexemes))
+        return corpus
+
+
+def load_corpus(path: str) -> List[str]:
+    """One expression per line; blank lines and # comments are skipped (same rules as the real-world suite)"""
+    corpus = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.split('#', 1)[0].strip()
+            if line:
+                corpus.append(line)
+    return corpus
+
+
+def print_report(report: DifferentialReport, max_disagreements: int = 10):
+    print("\n" + "=" * 80)
+    print("🔀 DIFFERENTIAL TESTING REPORT")
+    print("=" * 80)
+    print(f"\n📊 Corpus size: {report.corpus_size}")
+    for name, terminals in report.unknown_terminals.items():
+        print(f"⚠️  {name}: terminals {', '.join(terminals)} are never produced by the lexer; "
+              f"its rejects of inputs needing them are lexer artifacts")
+
+    print(f"\n⚡ ENGINE THROUGHPUT:")
+    for s in report.engines:
+        print(f"   {s.name:<12} accepted {s.accepted:>6}/{report.corpus_size:<6} "
+              f"{s.inputs_per_second:>10.0f} inputs/s {s.tokens_per_second:>12.0f} tokens/s")
+
+    print(f"\n🔍 DISAGREEMENTS: {len(report.disagreements)}")
+    for d in report.disagreements[:max_disagreements]:
+        verdicts = ', '.join(f"{name}={'ACCEPT' if ok else 'REJECT'}" for name, ok in d.verdicts.items())
+        print(f"   🔸 #{d.index}: {d.expression}")
+        print(f"      {verdicts}")
+    if len(report.disagreements) > max_disagreements:
+        print(f"   ... ({len(report.disagreements) - max_disagreements} more)")
+
+    if not report.disagreements:
+        print(f"   ✅ All engines agree on every input")
+    print("=" * 80)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Differential testing across grammar variants and parser engines")
+    parser.add_argument('--corpus', help="File with one expression per line (default: generated corpus)")
+    parser.add_argument('--generate', type=int, default=500, help="Number of generated inputs")
+    parser.add_argument('--seed', type=int, default=None, help="Seed for the corpus generator")
+    parser.add_argument('--engines', help=f"Comma separated, from: {', '.join(ENGINES)} "
+                                          f"(default: every engine whose terminals the lexer produces)")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: one per engine)")
+    parser.add_argument('--allow-unknown-terminals', action='store_true',
+                        help="Run engines whose grammar uses terminals the lexer never produces")
+    args = parser.parse_args(argv)
+
+    if args.engines:
+        engine_names = [name for name in args.engines.split(',') if name]
+    else:
+        engine_names = [name for name in ENGINES
+                        if args.allow_unknown_terminals or not unknown_terminals(engine_grammar(name))]
+    corpus = load_corpus(args.corpus) if args.corpus else CorpusGenerator(seed=args.seed).generate(args.generate)
+    try:
+        report = run_differential(corpus, engine_names, args.workers, args.allow_unknown_terminals)
+    except ValueError as e:
+        parser.error(str(e))
+    print_report(report)
+    return 1 if report.disagreements else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Grammar Spec Loader
+Read the EBNF production rules from the Markdown grammar documents
+
+The grammar docs (Updated_LL1_Grammar_PDF_Compliant.md, Corrected_LL1_Grammar_Documentation.md,
+Exceptional_LL1_Grammar_Analysis.md) each carry the full grammar in their first ```ebnf block.
+This module turns that block into the same structure LL1Parser.grammar uses:
+{non_terminal: [[symbol, ...], ...]} with ε written as 'EPSILON'.
+"""
+
+import re
+from typing import List, Dict, Optional
+
+EBNF_BLOCK = re.compile(r"^```ebnf[ \t]*\n(.*?)^```", re.MULTILINE | re.DOTALL)
+RULE_ARROW = re.compile(r"\s*(?:→|->|::=)\s*")
+EPSILON_SYMBOLS = {'ε', 'EPSILON'}
+
+
+def extract_ebnf_block(text: str) -> str:
+    """Return the first ```ebnf block of a Markdown document"""
+    match = EBNF_BLOCK.search(text)
+    if match is None:
+        raise ValueError("No ```ebnf block found in grammar spec")
+    return match.group(1)
+
+
+def parse_ebnf(block: str, terminal_aliases: Optional[Dict[str, str]] = None) -> Dict[str, List[List[str]]]:
+    """Parse EBNF production rules into the LL1Parser grammar structure"""
+    aliases = terminal_aliases or {}
+    grammar: Dict[str, List[List[str]]] = {}
+    current = None
+
+    for line_number, raw_line in enumerate(block.splitlines(), 1):
+        line = raw_line.split('#', 1)[0].strip()
+        if not line:
+            continue
+
+        if line.startswith('|'):
+            # Continuation of the previous rule's alternatives
+            if current is None:
+                raise ValueError(f"Alternative without a rule at spec line {line_number}: {raw_line.strip()}")
+            body = line[1:]
+        else:
+            parts = RULE_ARROW.split(line, maxsplit=1)
+            if len(parts) != 2 or not parts[0].isidentifier():
+                raise ValueError(f"Malformed production at spec line {line_number}: {raw_line.strip()}")
+            current = parts[0]
+            grammar.setdefault(current, [])
+            body = parts[1]
+
+        for alternative in body.split('|'):
+            symbols = alternative.split()
+            if not symbols:
+                raise ValueError(f"Empty alternative for {current} at spec line {line_number}")
+            if len(symbols) == 1 and symbols[0] in EPSILON_SYMBOLS:
+                grammar[current].append(['EPSILON'])
+            else:
+                grammar[current].append([aliases.get(symbol, symbol) for symbol in symbols])
+
+    if not grammar:
+        raise ValueError("Grammar spec contains no productions")
+    return grammar
+
+
+def load_grammar_from_markdown(path: str, terminal_aliases: Optional[Dict[str, str]] = None) -> Dict[str, List[List[str]]]:
+    """Load the grammar from the first ```ebnf block of a Markdown spec file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    return parse_ebnf(extract_ebnf_block(text), terminal_aliases)
@@ -7,371 +7,38 @@ This implementation creates a comprehensive LL(1) parser and runs all test cases
 to validate the grammar's capability and PDF compliance.
 """
 
-import re
-from typing import List, Dict, Tuple, Optional, Set
-from enum import Enum
-from dataclasses import dataclass
-
-class TokenType(Enum):
-    # Basic symbols
-    NUMERO_REAL = "NUMERO_REAL"
-    VARIAVEL = "VARIAVEL"
-    ABRE_PARENTESES = "ABRE_PARENTESES"
-    FECHA_PARENTESES = "FECHA_PARENTESES"
-    RES = "RES"
-    FIM = "FIM"
-
-    # Arithmetic operators (PDF compliant)
-    SOMA = "SOMA"
-    SUBTRACAO = "SUBTRACAO"
-    MULTIPLICACAO = "MULTIPLICACAO"
-    DIVISAO_REAL = "DIVISAO_REAL"        # | operator (PDF compliant)
-    DIVISAO_INTEIRA = "DIVISAO_INTEIRA"  # / operator (PDF compliant)
-    RESTO = "RESTO"
-    POTENCIA = "POTENCIA"
-
-    # Relational operators
-    MENOR = "MENOR"
-    MAIOR = "MAIOR"
-    MENOR_IGUAL = "MENOR_IGUAL"
-    MAIOR_IGUAL = "MAIOR_IGUAL"
-    IGUAL = "IGUAL"
-    DIFERENTE = "DIFERENTE"
-
-    # Logical operators
-    AND = "AND"
-    OR = "OR"
-    NOT = "NOT"
-
-    # Control structure keywords
-    FOR = "FOR"
-    WHILE = "WHILE"
-    IFELSE = "IFELSE"
-
-@dataclass
-class Token:
-    type: TokenType
-    value: str
-    line: int = 1
-    column: int = 1
-
-class PDFCompliantLexer:
-    """PDF compliant lexer with correct division operator tokenization"""
-
-    def __init__(self):
-        # PDF compliant token mapping
-        self.token_mapping = {
-            '(': TokenType.ABRE_PARENTESES,
-            ')': TokenType.FECHA_PARENTESES,
-            '+': TokenType.SOMA,
-            '-': TokenType.SUBTRACAO,
-            '*': TokenType.MULTIPLICACAO,
-            '|': TokenType.DIVISAO_REAL,      # PDF: Real division (pipe symbol)
-            '/': TokenType.DIVISAO_INTEIRA,   # PDF: Integer division (slash symbol)
-            '%': TokenType.RESTO,
-            '^': TokenType.POTENCIA,
-            '>': TokenType.MAIOR,
-            '<': TokenType.MENOR,
-            '>=': TokenType.MAIOR_IGUAL,
-            '<=': TokenType.MENOR_IGUAL,
-            '==': TokenType.IGUAL,
-            '!=': TokenType.DIFERENTE,
-            '&&': TokenType.AND,
-            '||': TokenType.OR,
-            '!': TokenType.NOT,
-            'AND': TokenType.AND,
-            'OR': TokenType.OR,
-            'NOT': TokenType.NOT,
-            'FOR': TokenType.FOR,
-            'WHILE': TokenType.WHILE,
-            'IFELSE': TokenType.IFELSE,
-            'RES': TokenType.RES,
-        }
-
-    def tokenize(self, text: str) -> List[Token]:
-        """Tokenize input text according to PDF specification"""
-        tokens = []
-        i = 0
-        line = 1
-        column = 1
-
-        while i < len(text):
-            # Skip whitespace
-            if text[i].isspace():
-                if text[i] == '\n':
-                    line += 1
-                    column = 1
-                else:
-                    column += 1
-                i += 1
-                continue
-
-            # Check for two-character operators first
-            if i + 1 < len(text):
-                two_char = text[i:i+2]
-                if two_char in self.token_mapping:
-                    tokens.append(Token(self.token_mapping[two_char], two_char, line, column))
-                    i += 2
-                    column += 2
-                    continue
-
-            # Single character operators and parentheses
-            if text[i] in self.token_mapping:
-                tokens.append(Token(self.token_mapping[text[i]], text[i], line, column))
-                i += 1
-                column += 1
-                continue
-
-            # Numbers (integers or floats)
-            if text[i].isdigit():
-                start = i
-                while i < len(text) and (text[i].isdigit() or text[i] == '.'):
-                    i += 1
-                value = text[start:i]
-                tokens.append(Token(TokenType.NUMERO_REAL, value, line, column))
-                column += len(value)
-                continue
-
-            # Variables and keywords (uppercase sequences)
-            if text[i].isupper():
-                start = i
-                while i < len(text) and text[i].isupper():
-                    i += 1
-                value = text[start:i]
-
-                # Check if it's a keyword
-                if value in self.token_mapping:
-                    tokens.append(Token(self.token_mapping[value], value, line, column))
-                else:
-                    tokens.append(Token(TokenType.VARIAVEL, value, line, column))
-                column += len(value)
-                continue
-
-            # Unrecognized character
-            raise SyntaxError(f"Unrecognized character '{text[i]}' at line {line}, column {column}")
-
-        # Add end-of-file marker
-        tokens.append(Token(TokenType.FIM, "FIM", line, column))
-        return tokens
-
-class LL1Parser:
-    """LL(1) parser implementing the PDF compliant grammar"""
-
-    def __init__(self):
-        # PDF compliant grammar from Updated_LL1_Grammar_PDF_Compliant.md
-        self.grammar = {
-            'PROGRAM': [['LINHA', 'PROGRAM_PRIME']],
-            'PROGRAM_PRIME': [['LINHA', 'PROGRAM_PRIME'], ['EPSILON']],
-            'LINHA': [['ABRE_PARENTESES', 'CONTENT', 'FECHA_PARENTESES']],
-            'CONTENT': [
-                ['NUMERO_REAL', 'AFTER_NUM'],
-                ['VARIAVEL', 'AFTER_VAR'],
-                ['ABRE_PARENTESES', 'EXPR', 'FECHA_PARENTESES', 'AFTER_EXPR'],
-                ['FOR', 'FOR_STRUCT'],
-                ['WHILE', 'WHILE_STRUCT'],
-                ['IFELSE', 'IFELSE_STRUCT']
-            ],
-            'AFTER_NUM': [
-                ['NUMERO_REAL', 'OPERATOR'],
-                ['VARIAVEL', 'AFTER_VAR_OP'],
-                ['ABRE_PARENTESES', 'EXPR', 'FECHA_PARENTESES', 'OPERATOR'],
-                ['NUMERO_REAL', 'OPERATOR', 'VARIAVEL'],  # Store arithmetic result in memory
-                ['VARIAVEL', 'OPERATOR', 'VARIAVEL'],     # Store arithmetic result in memory
-                ['VARIAVEL'],                             # Store number in memory (no operator)
-                ['RES']
-            ],
-            'AFTER_VAR_OP': [['OPERATOR'], ['EPSILON']],
-            'AFTER_VAR': [
-                ['NUMERO_REAL', 'OPERATOR'],
-                ['VARIAVEL', 'OPERATOR'],
-                ['ABRE_PARENTESES', 'EXPR', 'FECHA_PARENTESES', 'OPERATOR'],
-                ['EPSILON']
-            ],
-            'AFTER_EXPR': [
-                ['NUMERO_REAL', 'OPERATOR'],
-                ['VARIAVEL', 'AFTER_VAR_OP'],
-                ['ABRE_PARENTESES', 'EXPR', 'FECHA_PARENTESES', 'OPERATOR'],
-                ['UNARY_OP']                              # Unary operator support
-            ],
-            'EXPR': [
-                ['NUMERO_REAL', 'AFTER_NUM'],
-                ['VARIAVEL', 'AFTER_VAR'],
-                ['ABRE_PARENTESES', 'EXPR', 'FECHA_PARENTESES', 'AFTER_EXPR']
-            ],
-            'OPERATOR': [['ARITH_OP'], ['COMP_OP'], ['LOGIC_OP']],
-            'ARITH_OP': [
-                ['SOMA'], ['SUBTRACAO'], ['MULTIPLICACAO'],
-                ['DIVISAO_REAL'], ['DIVISAO_INTEIRA'],  # PDF compliant division
-                ['RESTO'], ['POTENCIA']
-            ],
-            'COMP_OP': [
-                ['MENOR'], ['MAIOR'], ['IGUAL'],
-                ['MENOR_IGUAL'], ['MAIOR_IGUAL'], ['DIFERENTE']
-            ],
-            'LOGIC_OP': [['AND'], ['OR'], ['NOT']],
-            'UNARY_OP': [['NOT']],                       # Unary logical operators
-            'FOR_STRUCT': [['NUMERO_REAL', 'NUMERO_REAL', 'VARIAVEL', 'LINHA']],
-            'WHILE_STRUCT': [['ABRE_PARENTESES', 'EXPR', 'FECHA_PARENTESES', 'LINHA']],
-            'IFELSE_STRUCT': [['ABRE_PARENTESES', 'EXPR', 'FECHA_PARENTESES', 'LINHA', 'LINHA']]
-        }
-
-        # Build parsing table
-        self.parsing_table = self._build_parsing_table()
-
-    def _calculate_first_sets(self) -> Dict[str, Set[str]]:
-        """Calculate FIRST sets for all symbols"""
-        first_sets = {}
-
-        # Initialize FIRST sets
-        for non_terminal in self.grammar:
-            first_sets[non_terminal] = set()
-
-        # Add terminals
-        for token_type in TokenType:
-            first_sets[token_type.value] = {token_type.value}
-        first_sets['EPSILON'] = {'EPSILON'}
-
-        # Calculate FIRST sets using fixed-point algorithm
-        changed = True
-        while changed:
-            changed = False
-            for non_terminal in self.grammar:
-                old_size = len(first_sets[non_terminal])
-
-                for production in self.grammar[non_terminal]:
-                    if production == ['EPSILON']:
-                        first_sets[non_terminal].add('EPSILON')
-                        continue
-
-                    for symbol in production:
-                        first_sets[non_terminal].update(first_sets[symbol] - {'EPSILON'})
-                        if 'EPSILON' not in first_sets[symbol]:
-                            break
-                    else:
-                        # All symbols can derive epsilon
-                        first_sets[non_terminal].add('EPSILON')
-
-                if len(first_sets[non_terminal]) > old_size:
-                    changed = True
-
-        return first_sets
-
-    def _calculate_follow_sets(self, first_sets: Dict[str, Set[str]]) -> Dict[str, Set[str]]:
-        """Calculate FOLLOW sets for all non-terminals"""
-        follow_sets = {}
-
-        # Initialize FOLLOW sets
-        for non_terminal in self.grammar:
-            follow_sets[non_terminal] = set()
-
-        # Start symbol gets end-of-input marker
-        follow_sets['PROGRAM'] = {'FIM'}
-
-        # Calculate FOLLOW sets using fixed-point algorithm
-        changed = True
-        while changed:
-            changed = False
-
-            for non_terminal in self.grammar:
-                for production in self.grammar[non_terminal]:
-                    for i, symbol in enumerate(production):
-                        if symbol in self.grammar:  # Is non-terminal
-                            old_size = len(follow_sets[symbol])
-
-                            # Add FIRST of everything after this symbol
-                            if i + 1 < len(production):
-                                for j in range(i + 1, len(production)):
-                                    follow_sets[symbol].update(first_sets[production[j]] - {'EPSILON'})
-                                    if 'EPSILON' not in first_sets[production[j]]:
-                                        break
-                                else:
-                                    # All following symbols can derive epsilon
-                                    follow_sets[symbol].update(follow_sets[non_terminal])
-                            else:
-                                # Last symbol in production
-                                follow_sets[symbol].update(follow_sets[non_terminal])
-
-                            if len(follow_sets[symbol]) > old_size:
-                                changed = True
-
-        return follow_sets
-
-    def _build_parsing_table(self) -> Dict[Tuple[str, str], List[str]]:
-        """Build LL(1) parsing table"""
-        first_sets = self._calculate_first_sets()
-        follow_sets = self._calculate_follow_sets(first_sets)
-
-        parsing_table = {}
-
-        for non_terminal in self.grammar:
-            for production in self.grammar[non_terminal]:
-                # Add entries for all terminals in FIRST(production)
-                if production == ['EPSILON']:
-                    # Add entries for all terminals in FOLLOW(non_terminal)
-                    for terminal in follow_sets[non_terminal]:
-                        if terminal != 'EPSILON':
-                            parsing_table[(non_terminal, terminal)] = production
-                else:
-                    for symbol in production:
-                        for terminal in first_sets[symbol]:
-                            if terminal != 'EPSILON':
-                                parsing_table[(non_terminal, terminal)] = production
-                        if 'EPSILON' not in first_sets[symbol]:
-                            break
-                    else:
-                        # All symbols can derive epsilon
-                        for terminal in follow_sets[non_terminal]:
-                            if terminal != 'EPSILON':
-                                parsing_table[(non_terminal, terminal)] = production
-
-        return parsing_table
-
-    def parse(self, tokens: List[Token]) -> Tuple[bool, List[str], str]:
-        """
-        Parse tokens using LL(1) parser
-        Returns: (success, derivation_sequence, error_message)
-        """
-        try:
-            stack = ['FIM', 'PROGRAM']  # Bottom-up: FIM, then start symbol
-            input_tokens = [token.type.value for token in tokens]
-            input_index = 0
-            derivation = []
-
-            while len(stack) > 1:  # While not just FIM on stack
-                top = stack[-1]
-                current_input = input_tokens[input_index] if input_index < len(input_tokens) else 'FIM'
-
-                if top == current_input:
-                    # Terminal match
-                    stack.pop()
-                    input_index += 1
-                    derivation.append(f"Match terminal: {top}")
-                elif top in self.grammar:
-                    # Non-terminal - use parsing table
-                    table_key = (top, current_input)
-                    if table_key in self.parsing_table:
-                        production = self.parsing_table[table_key]
-                        stack.pop()
-
-                        if production != ['EPSILON']:
-                            # Add production symbols in reverse order
-                            for symbol in reversed(production):
-                                stack.append(symbol)
-
-                        derivation.append(f"{top} → {' '.join(production)}")
-                    else:
-                        return False, derivation, f"No rule for ({top}, {current_input}) in parsing table"
-                else:
-                    return False, derivation, f"Unexpected symbol on stack: {top}"
-
-            # Check if all input consumed
-            if input_index < len(input_tokens) - 1:  # -1 for FIM token
-                return False, derivation, f"Input not fully consumed. Remaining: {input_tokens[input_index:]}"
-
-            return True, derivation, "Parse successful"
-
-        except Exception as e:
-            return False, [], f"Parse error: {str(e)}"
+import os
+import sys
+import time
+import subprocess
+from typing import List, Dict, Tuple
+
+from ll1_core import (
+    TokenType, Token, PDFCompliantLexer, LL1Parser, CompiledGrammar,
+    PDF_COMPLIANT_GRAMMAR, GRAMMAR_REGISTRY, grammar_hash,
+    ParseLimits, LimitExceededError, SemanticChecker, ERROR_CONTEXT_VALUE_WIDTH, DEFAULT_MAX_STACK_DEPTH,
+)
+
+# Startup budget for the slim validator CLI: total self import time of the modules it loads
+# on top of a bare interpreter, measured with -X importtime and warm bytecode caches
+STARTUP_IMPORT_BUDGET_MS = 25.0
+
+# Parse-time scaling: per-token time at SCALING_FACTOR x the base size may be at most
+# SCALING_TOLERANCE x the per-token time at the base size
+SCALING_BASE_SIZE = 400
+SCALING_FACTOR = 8
+SCALING_TOLERANCE = 3.0
+
+# Generated inputs compared between LL1Parser and CompressedTableParser
+COMPRESSED_CORPUS_SIZE = 2000
+COMPRESSED_CORPUS_SEED = 31
+COMPRESSED_STACK_LIMITS = range(2, 13)    # max_stack_depth values replayed over the corpus for C.5
+
+# Modules the validation path of ll1_validate.py must not import
+SLIM_FORBIDDEN_MODULES = (
+    'grammar_vigorous_test', 'differential_harness', 'grammar_loader',
+    'typing', 'dataclasses', 'hashlib', 'json', 'argparse',
+)
 
 class GrammarTestRunner:
     """Comprehensive test runner for grammar validation"""
@@ -523,9 +190,10 @@ class GrammarTestRunner:
 
             print(f"📊 Found {len(expressions)} real-world expressions to test")
 
-            # Test each expression
+            # Test each expression; one checker spans the file so stores and RES history carry over
             passed = 0
             total = len(expressions)
+            checker = SemanticChecker()
 
             for test_name, expression, description in expressions:
                 print(f"\n🔍 Testing: {test_name}")
@@ -537,13 +205,17 @@ class GrammarTestRunner:
                     tokens = self.lexer.tokenize(expression)
                     print(f"🔤 Tokens: {[f'{t.type.value}({t.value})' for t in tokens if t.type != TokenType.FIM]}")
 
+                    # Parse, with semantic pre-checks collected in the same pass
+                    issues_before = len(checker.issues)
+                    success, derivation, message = self.parser.parse(tokens, checker)
+                    histogram = checker.histogram
+
                     # Check for PDF division compliance
-                    division_analysis = self._analyze_division_compliance(tokens)
+                    division_analysis = self._analyze_division_compliance(histogram)
                     if division_analysis:
                         print(f"📋 Division Analysis: {division_analysis}")
-
-                    # Parse
-                    success, derivation, message = self.parser.parse(tokens)
+                    for issue in checker.issues[issues_before:]:
+                        print(f"⚠️  Semantic: {issue}")
 
                     print(f"✅ Result: {'SUCCESS' if success else 'FAILURE'}")
                     print(f"💬 Message: {message}")
@@ -560,13 +232,19 @@ class GrammarTestRunner:
                         'success': success,
                         'message': message,
                         'description': description,
-                        'tokens': len([t for t in tokens if t.type != TokenType.FIM]),
-                        'derivation_steps': len(derivation) if derivation else 0
+                        'tokens': len(tokens) - 1,  # -1 for FIM token
+                        'derivation_steps': len(derivation) if derivation else 0,
+                        'real_divisions': histogram.get(TokenType.DIVISAO_REAL.value, 0),
+                        'int_divisions': histogram.get(TokenType.DIVISAO_INTEIRA.value, 0),
+                        'semantic_issues': len(checker.issues) - issues_before
                     })
 
                 except Exception as e:
                     print(f"💥 Exception: {str(e)}")
                     print("🏆 Test Status: ❌ FAIL")
+                    # No tokens to count from (usually a lexer error); count the operator characters
+                    # so the expression still counts towards the division totals ('||' is OR)
+                    operators = expression.replace('||', '')
                     self.real_world_results.append({
                         'name': test_name,
                         'expression': expression,
@@ -574,21 +252,24 @@ class GrammarTestRunner:
                         'message': f"Exception: {str(e)}",
                         'description': description,
                         'tokens': 0,
-                        'derivation_steps': 0
+                        'derivation_steps': 0,
+                        'real_divisions': operators.count('|'),
+                        'int_divisions': operators.count('/'),
+                        'semantic_issues': 0
                     })
 
             # Generate real-world test report
-            self._generate_real_world_report(passed, total)
+            self._generate_real_world_report(passed, total, checker)
 
         except FileNotFoundError:
             print(f"❌ ERROR: Test file not found: {test_file_path}")
         except Exception as e:
             print(f"❌ ERROR: Failed to load test file: {str(e)}")
 
-    def _analyze_division_compliance(self, tokens: List[Token]) -> str:
-        """Analyze PDF division compliance in tokens"""
-        real_divisions = sum(1 for t in tokens if t.type == TokenType.DIVISAO_REAL)
-        int_divisions = sum(1 for t in tokens if t.type == TokenType.DIVISAO_INTEIRA)
+    def _analyze_division_compliance(self, histogram: Dict[str, int]) -> str:
+        """Analyze PDF division compliance from the parse pass's token-type histogram"""
+        real_divisions = histogram.get(TokenType.DIVISAO_REAL.value, 0)
+        int_divisions = histogram.get(TokenType.DIVISAO_INTEIRA.value, 0)
 
         if real_divisions == 0 and int_divisions == 0:
             return ""
@@ -601,7 +282,7 @@ class GrammarTestRunner:
 
         return " | ".join(analysis)
 
-    def _generate_real_world_report(self, passed: int, total: int):
+    def _generate_real_world_report(self, passed: int, total: int, checker: SemanticChecker):
         """Generate real-world testing report"""
         print("\n" + "=" * 80)
         print("🌍 REAL-WORLD TESTING REPORT")
@@ -626,13 +307,23 @@ class GrammarTestRunner:
             print(f"   Average derivation steps: {avg_derivation:.1f}")
 
         # Division compliance analysis
-        division_expressions = [r for r in self.real_world_results if 'division' in r['description'].lower() or '|' in r['expression'] or '/' in r['expression']]
+        division_expressions = [r for r in self.real_world_results
+                                if 'division' in r['description'].lower() or r['real_divisions'] or r['int_divisions']]
         if division_expressions:
             division_passed = sum(1 for r in division_expressions if r['success'])
             print(f"\n🔍 PDF DIVISION COMPLIANCE:")
             print(f"   Division expressions: {len(division_expressions)}")
             print(f"   Division tests passed: {division_passed}/{len(division_expressions)}")
 
+        # Semantic pre-check findings, collected during parsing
+        if checker.issues:
+            kinds: Dict[str, int] = {}
+            for issue in checker.issues:
+                kinds[issue.kind] = kinds.get(issue.kind, 0) + 1
+            print(f"\n⚠️  SEMANTIC PRE-CHECKS:")
+            for kind, count in kinds.items():
+                print(f"   {kind}: {count}")
+
         # Failed tests details
         failed_tests = [r for r in self.real_world_results if not r['success']]
         if failed_tests:
@@ -643,6 +334,372 @@ class GrammarTestRunner:
 
         print("=" * 80)
 
+    def _import_profile(self, args: List[str], input_text: str = "") -> Dict[str, int]:
+        """Run the interpreter under -X importtime and return {module: self time in us}"""
+        env = dict(os.environ)
+        env.pop('PYTHONDONTWRITEBYTECODE', None)  # measure with warm bytecode, as installed scripts run
+        result = subprocess.run([sys.executable, '-X', 'importtime'] + args, input=input_text,
+                                capture_output=True, text=True, env=env,
+                                cwd=os.path.dirname(os.path.abspath(__file__)))
+        modules = {}
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:'):
+                continue
+            fields = line[len('import time:'):].split('|')
+            if len(fields) == 3 and fields[0].strip().isdigit():
+                modules[fields[2].strip()] = int(fields[0])
+        return modules
+
+    def _record_check(self, test_name: str, passed: bool, message: str, description: str):
+        print(f"\n🔍 Testing: {test_name}")
+        print(f"📋 Description: {description}")
+        print(f"💬 Message: {message}")
+        print(f"🏆 Test Status: {'✅ PASS' if passed else '❌ FAIL'}")
+        self.test_results.append({
+            'name': test_name,
+            'input': '',
+            'expected': True,
+            'actual': passed,
+            'passed': passed,
+            'message': message,
+            'description': description
+        })
+
+    def run_error_message_tests(self):
+        """Check the exact syntax error messages: location, expected terminals and the bounded context"""
+        print("\n🎯 CATEGORY E: SYNTAX ERROR MESSAGES")
+
+        def message(text: str) -> str:
+            return self.parser.parse(self.lexer.tokenize(text))[2]
+
+        long_name = "A" * 40
+        cases = [
+            ("E.1", "( 1 2 + ) )",
+             "Syntax error at line 1, column 9: unexpected FECHA_PARENTESES ')'; expected VARIAVEL. "
+             "Near: ( 1 2 + >>)<< )",
+             "Mid-line error: location, found token, expected terminal and marked context"),
+            ("E.2", "( 1 X",
+             "Syntax error at line 1, column 6: unexpected end of input; expected FECHA_PARENTESES. "
+             "Near: ( 1 X >><end of input><<",
+             "Unexpected end of input is reported at the position after the last token"),
+            ("E.3", "( 1 X )\n( 2 Y )\n  ( 3 + )",
+             "Syntax error at line 3, column 7: unexpected SOMA '+' in AFTER_NUM; expected one of: "
+             "ABRE_PARENTESES, NUMERO_REAL, RES, VARIAVEL. Near: ... Y ) ( 3 >>+<< )",
+             "Multi-line input: line and column of the offending token, context clipped on the left"),
+            ("E.4", "( 1 2 3 4 5 6 7 8 9 + X )",
+             "Syntax error at line 1, column 7: unexpected NUMERO_REAL '3' in OPERATOR; expected one of: "
+             "AND, DIFERENTE, DIVISAO_INTEIRA, DIVISAO_REAL, IGUAL, MAIOR, MAIOR_IGUAL, MENOR, MENOR_IGUAL, "
+             "MULTIPLICACAO, NOT, OR, POTENCIA, RESTO, SOMA, SUBTRACAO. Near: ( 1 2 >>3<< 4 5 6 7 ...",
+             "Sorted expected-terminal list of the non-terminal, context clipped on the right"),
+            ("E.5", f"( 1 X ) ( 2 {long_name} ) ) ( 3 Z ) ( 4 W )",
+             "Syntax error at line 1, column 56: unexpected FECHA_PARENTESES ')' in PROGRAM_PRIME; expected one of: "
+             f"ABRE_PARENTESES, FIM. Near: ... ( 2 {long_name[:ERROR_CONTEXT_VALUE_WIDTH]}… ) >>)<< ( 3 Z ) ...",
+             "Context clipped on both sides, long token values truncated to ERROR_CONTEXT_VALUE_WIDTH"),
+        ]
+        for name, text, expected, description in cases:
+            actual = message(text)
+            self._record_check(name, actual == expected, actual if actual == expected else f"got: {actual}",
+                               description)
+
+        text = "( 1 X ) " * 3000 + "( 1 + )"
+        actual = message(text)
+        expected = ("Syntax error at line 1, column 24005: unexpected SOMA '+' in AFTER_NUM; expected one of: "
+                    "ABRE_PARENTESES, NUMERO_REAL, RES, VARIAVEL. Near: ... X ) ( 1 >>+<< )")
+        self._record_check("E.6", actual == expected and len(actual) < 200,
+                           f"{len(self.lexer.tokenize(text))} tokens, message of {len(actual)} characters: {actual}",
+                           "A 12k-token input still gets a short message with the context window only")
+
+        passed = sum(1 for r in self.test_results if r['name'].startswith('E.') and r['passed'])
+        print(f"\n📊 SYNTAX ERROR MESSAGE RESULTS: {passed}/6 passed")
+        print("=" * 80)
+
+    def run_startup_tests(self):
+        """Check the validator CLI's import set and startup time budget"""
+        print("\n🎯 CATEGORY S: VALIDATOR STARTUP BUDGET")
+        cli_args = ['ll1_validate.py', '-']
+        sample = "( A B + )\n"
+
+        # Warm-up run writes bytecode and the precompiled parsing table
+        self._import_profile(cli_args, sample)
+        baseline = self._import_profile(['-c', 'pass'])
+        profile = self._import_profile(cli_args, sample)
+        extra = {name: us for name, us in profile.items() if name not in baseline}
+
+        forbidden = [name for name in SLIM_FORBIDDEN_MODULES if name in extra]
+        self._record_check("S.1", not forbidden,
+                           f"Forbidden imports: {', '.join(forbidden)}" if forbidden else "No heavy modules imported",
+                           "Validation path imports only ll1_core and its light dependencies")
+
+        total_ms = sum(extra.values()) / 1000
+        slowest = sorted(extra.items(), key=lambda item: item[1], reverse=True)[:3]
+        breakdown = ', '.join(f"{name} {us / 1000:.1f}ms" for name, us in slowest)
+        self._record_check("S.2", total_ms <= STARTUP_IMPORT_BUDGET_MS,
+                           f"{total_ms:.1f}ms of {STARTUP_IMPORT_BUDGET_MS:.1f}ms budget ({breakdown})",
+                           "Import time of the validator on top of a bare interpreter")
+
+        passed = sum(1 for r in self.test_results if r['name'].startswith('S.') and r['passed'])
+        print(f"\n📊 STARTUP RESULTS: {passed}/2 passed")
+        print("=" * 80)
+
+    def _nested_input(self, depth: int) -> str:
+        """( ( ( A B + ) C ) C ... ) nested depth levels deep"""
+        expression = "A B +"
+        for _ in range(depth):
+            expression = f"( {expression} ) C"
+        return f"( {expression} )"
+
+    def _wide_input(self, lines: int) -> str:
+        """A PROGRAM of many short LINHAs"""
+        return "\n".join("( A B + )" for _ in range(lines))
+
+    def _time_per_token(self, text: str, repeats: int = 3) -> float:
+        """Best-of-N lex + parse time per token, in seconds"""
+        lexer = PDFCompliantLexer(ParseLimits(None, None, None))
+        parser = LL1Parser(limits=ParseLimits(None, None, None))
+        best = float('inf')
+        for _ in range(repeats):
+            start = time.perf_counter()
+            tokens = lexer.tokenize(text)
+            success, _, message = parser.parse(tokens)
+            best = min(best, time.perf_counter() - start)
+            if not success:
+                raise AssertionError(message)
+        return best / len(tokens)
+
+    def run_scaling_tests(self):
+        """Check resource limits and that parse time stays linear on adversarial inputs"""
+        print("\n🎯 CATEGORY L: RESOURCE LIMITS AND LINEAR-TIME PARSING")
+        limits = ParseLimits(max_stack_depth=200, max_tokens_per_line=50, max_input_bytes=1000)
+        parser = LL1Parser(limits=limits)
+
+        success, _, message = parser.parse(PDFCompliantLexer().tokenize("( " * 120 + "A"))
+        self._record_check("L.1", not success and message.startswith("Nesting limit exceeded"), message[:160],
+                           "Deep nesting stops at max_stack_depth with a located error")
+
+        lexer = PDFCompliantLexer(limits)
+        for name, text, description in (
+            ("L.2", "( " + "1 " * 60 + ")", "LINHA longer than max_tokens_per_line is rejected by the lexer"),
+            ("L.3", "( A B + ) " * 150, "Input larger than max_input_bytes is rejected before lexing"),
+        ):
+            try:
+                lexer.tokenize(text)
+                self._record_check(name, False, "No LimitExceededError raised", description)
+            except LimitExceededError as e:
+                self._record_check(name, True, str(e), description)
+
+        for name, build, description in (
+            ("L.4", self._nested_input, "Parse time stays linear in nesting depth"),
+            ("L.5", self._wide_input, "Parse time stays linear in PROGRAM_PRIME width"),
+        ):
+            base = self._time_per_token(build(SCALING_BASE_SIZE))
+            large = self._time_per_token(build(SCALING_BASE_SIZE * SCALING_FACTOR))
+            ratio = large / base
+            self._record_check(name, ratio <= SCALING_TOLERANCE,
+                               f"per-token time x{ratio:.2f} at {SCALING_FACTOR}x size "
+                               f"({base * 1e6:.2f}us -> {large * 1e6:.2f}us, tolerance x{SCALING_TOLERANCE:.1f})",
+                               description)
+
+        passed = sum(1 for r in self.test_results if r['name'].startswith('L.') and r['passed'])
+        print(f"\n📊 LIMITS AND SCALING RESULTS: {passed}/5 passed")
+        print("=" * 80)
+
+    def run_grammar_spec_tests(self):
+        """Check the spec loader, that the built-in grammar matches its spec, and the compiled-grammar registry"""
+        from grammar_loader import parse_ebnf, load_grammar_from_markdown
+        print("\n🎯 CATEGORY G: GRAMMAR SPEC LOADER AND REGISTRY")
+        spec_dir = os.path.dirname(os.path.abspath(__file__))
+
+        spec = load_grammar_from_markdown(os.path.join(spec_dir, 'Updated_LL1_Grammar_PDF_Compliant.md'))
+        drift = sorted(nt for nt in set(spec) | set(PDF_COMPLIANT_GRAMMAR)
+                       if spec.get(nt) != PDF_COMPLIANT_GRAMMAR.get(nt))
+        self._record_check("G.1", spec == PDF_COMPLIANT_GRAMMAR,
+                           f"Rules differing from the spec: {', '.join(drift)}" if drift else "Built-in grammar matches spec",
+                           "PDF_COMPLIANT_GRAMMAR equals the EBNF block of Updated_LL1_Grammar_PDF_Compliant.md")
+
+        parsed = parse_ebnf("A → B c | ε   # comment\n  | d\nB -> x\n", {'x': 'X'})
+        expected = {'A': [['B', 'c'], ['EPSILON'], ['d']], 'B': [['X']]}
+        self._record_check("G.2", parsed == expected, f"Parsed: {parsed}",
+                           "Alternatives, continuation lines, ε, comments, arrows and terminal aliases")
+
+        malformed = ["| A", "A B C", "A → B ||", "# only a comment"]
+        accepted = []
+        for block in malformed:
+            try:
+                parse_ebnf(block)
+                accepted.append(block)
+            except ValueError:
+                pass
+        self._record_check("G.3", not accepted,
+                           f"Accepted malformed specs: {accepted}" if accepted else f"All {len(malformed)} malformed specs rejected",
+                           "Malformed EBNF raises ValueError")
+
+        copy = {nt: [list(p) for p in productions] for nt, productions in PDF_COMPLIANT_GRAMMAR.items()}
+        shared = LL1Parser(copy).compiled is LL1Parser().compiled is LL1Parser(spec).compiled
+        registered = GRAMMAR_REGISTRY.get(grammar_hash(PDF_COMPLIANT_GRAMMAR)) is LL1Parser().compiled
+        self._record_check("G.4", shared and registered, f"Shared: {shared}, registered: {registered}",
+                           "Equal grammars share one compiled table through the registry")
+
+        changed = dict(copy, UNARY_OP=[['NOT'], ['EPSILON']])
+        distinct = LL1Parser(changed).compiled is not LL1Parser().compiled
+        self._record_check("G.5", distinct, f"Distinct compiled grammar: {distinct}",
+                           "A different grammar gets its own registry entry")
+
+        mutable = {nt: [list(p) for p in productions] for nt, productions in PDF_COMPLIANT_GRAMMAR.items()}
+        mutable['UNARY_OP'].append(['SUBTRACAO'])
+        key = grammar_hash(mutable)
+        compiled = LL1Parser(mutable).compiled
+        mutable['UNARY_OP'].append(['SOMA'])
+        mutable['UNARY_OP'][0].append('NOT')
+        intact = grammar_hash(compiled.grammar) == key and GRAMMAR_REGISTRY[key] is compiled
+        self._record_check("G.6", intact, f"Registry entry still hashes to its key: {intact}",
+                           "Mutating the caller's grammar after building a parser leaves the registry entry intact")
+
+        passed = sum(1 for r in self.test_results if r['name'].startswith('G.') and r['passed'])
+        print(f"\n📊 GRAMMAR SPEC RESULTS: {passed}/6 passed")
+        print("=" * 80)
+
+    def run_compressed_table_tests(self):
+        """Check that CompressedTableParser behaves exactly like LL1Parser on a generated corpus"""
+        import tempfile
+        from differential_harness import CorpusGenerator
+        from table_stats import CompressedTable, CompressedTableParser, compress_table
+        print("\n🎯 CATEGORY C: COMPRESSED PARSE TABLE")
+
+        corpus = []
+        for expression in CorpusGenerator(seed=COMPRESSED_CORPUS_SEED).generate(COMPRESSED_CORPUS_SIZE):
+            try:
+                corpus.append((expression, self.lexer.tokenize(expression)))
+            except SyntaxError:
+                pass
+
+        def compare(engine: CompressedTableParser, check_messages: bool) -> List[str]:
+            mismatches = []
+            for expression, tokens in corpus:
+                expected, actual = self.parser.parse(tokens), engine.parse(tokens)
+                same = expected[0] == actual[0]
+                if check_messages:
+                    # Derivations are compared on success only; after a row default the failing
+                    # derivation legitimately holds the extra default expansions
+                    same = same and expected[2] == actual[2] and (not expected[0] or expected[1] == actual[1])
+                if not same:
+                    mismatches.append(expression)
+            return mismatches
+
+        def record(name: str, mismatches: List[str], description: str):
+            message = (f"{len(mismatches)}/{len(corpus)} inputs differ, first: {mismatches[0]}" if mismatches
+                       else f"{len(corpus)} generated inputs agree")
+            self._record_check(name, not mismatches, message, description)
+
+        compressed = compress_table(self.parser.compiled)
+        record("C.1", compare(CompressedTableParser(compressed), False),
+               "Compressed table with row defaults accepts exactly what LL1Parser accepts")
+        record("C.2", compare(CompressedTableParser(compressed), True),
+               "Error messages, and derivations of accepted inputs, match LL1Parser despite row defaults")
+        record("C.3", compare(CompressedTableParser(compress_table(self.parser.compiled, use_defaults=False)), True),
+               "Compressed table without defaults matches LL1Parser")
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'table.marshal')
+            compressed.save(path)
+            loaded = CompressedTable.load(path)
+        record("C.4", compare(CompressedTableParser(loaded), True),
+               "Emitted table file parses identically after loading")
+
+        # Near max_stack_depth a default taken on a bad lookahead must still yield LL1Parser's syntax error
+        deep = "( " * (DEFAULT_MAX_STACK_DEPTH // 2 - 2) + "1 ) )"
+        cases = [(limits, tokens) for limits in map(ParseLimits, COMPRESSED_STACK_LIMITS) for _, tokens in corpus]
+        cases.append((ParseLimits(), self.lexer.tokenize(deep)))
+        mismatches = []
+        for limits, tokens in cases:
+            expected = LL1Parser(compiled=self.parser.compiled, limits=limits).parse(tokens)[2]
+            if CompressedTableParser(compressed, limits).parse(tokens)[2] != expected:
+                mismatches.append(f"max_stack_depth={limits.max_stack_depth}: {expected[:60]}")
+        self._record_check("C.5", not mismatches,
+                           (f"{len(mismatches)}/{len(cases)} messages differ, first: {mismatches[0]}" if mismatches
+                            else f"{len(cases)} parses near the stack limit agree"),
+                           "Messages match LL1Parser when the stack limit trips after a row default")
+
+        passed = sum(1 for r in self.test_results if r['name'].startswith('C.') and r['passed'])
+        print(f"\n📊 COMPRESSED TABLE RESULTS: {passed}/5 passed")
+        print("=" * 80)
+
+    def _check_program(self, lines: List[str], engine=None,
+                       checker: SemanticChecker = None) -> Tuple[List[bool], SemanticChecker]:
+        """Parse lines in order with one SemanticChecker on engine (default self.parser); returns the verdicts and the checker"""
+        engine = engine or self.parser
+        checker = checker or SemanticChecker()
+        verdicts = [engine.parse(self.lexer.tokenize(line), checker)[0] for line in lines]
+        return verdicts, checker
+
+    def run_semantic_tests(self):
+        """Check the semantic pre-checks the parser feeds while matching terminals"""
+        from table_stats import CompressedTableParser
+        print("\n🎯 CATEGORY P: SEMANTIC PRE-CHECKS")
+
+        def findings(checker: SemanticChecker) -> List[str]:
+            return [f"{issue.kind}@{issue.line}:{issue.column}" for issue in checker.issues]
+
+        verdicts, checker = self._check_program(["( X )", "( Y 2 * )", "( X 1 + )", "( A B | )"])
+        reads = [issue.message for issue in checker.issues if issue.kind == 'read-before-store']
+        expected = [f"variable '{name}' read before any store" for name in ('X', 'Y', 'A', 'B')]
+        self._record_check("P.1", all(verdicts) and reads == expected, f"reported: {reads}",
+                           "Reads before any store are reported once per variable, for ( X ) and operands")
+
+        verdicts, checker = self._check_program(["( 5 X )", "( ( X 1 + ) C )", "( 42.5 6.5 | D )",
+                                                 "( FOR 1 10 I ( I 2 * ) )", "( X C + )", "( D I * )"])
+        self._record_check("P.2", all(verdicts) and checker.stored == {'X', 'C', 'D', 'I'} and not checker.issues,
+                           f"stored: {sorted(checker.stored)}, issues: {findings(checker)}",
+                           "( V X ), ( ( EXPR ) X ), ( A B op X ) and the FOR variable all store")
+
+        huge = "9" * 400
+        verdicts, checker = self._check_program(["( 1 2 + X )", "( 1 RES )", "( 3 RES )", "( 1.5 RES )",
+                                                 "( 0 RES )", f"( {huge} RES )"])
+        out_of_range = [issue.line for issue in checker.issues if issue.kind == 'res-out-of-range']
+        self._record_check("P.3", all(verdicts) and len(out_of_range) == 4, f"issues: {findings(checker)}",
+                           "RES beyond the completed lines, non-whole or huge offsets are reported, never rejected")
+
+        verdicts, checker = self._check_program(["( A 2.5 / )", "( A 2.5 | )", "( A 2 / )"])
+        divisions = [issue.message for issue in checker.issues if issue.kind == 'integer-division-real']
+        self._record_check("P.4", all(verdicts) and divisions == ["integer division '/' applied to real literal 2.5"],
+                           f"reported: {divisions}", "Integer division applied to a real literal is reported")
+
+        histograms = []
+        for engine in (self.parser, CompressedTableParser()):
+            for line in ("( A B | )", "( ( A B + ) / )"):
+                histograms.append(self._check_program([line], engine)[1].histogram)
+        counts = [(h.get('DIVISAO_REAL', 0), h.get('DIVISAO_INTEIRA', 0), h.get('VARIAVEL', 0)) for h in histograms]
+        self._record_check("P.5", counts == [(1, 0, 2), (0, 1, 2)] * 2, f"(|, /, VARIAVEL) counts: {counts}",
+                           "Histogram counts the whole input, including the tail after a syntax error")
+
+        results = []
+        for engine in (self.parser, CompressedTableParser()):
+            verdicts, checker = self._check_program(["( 5.0 2 / )", "( 5 Z ) )", "( Y 1 + ) )", "( 1 RES )",
+                                                     "( Z )"], engine)
+            results.append((verdicts, findings(checker), sorted(checker.stored), checker.history))
+        expected = ([False, False, False, True, True],
+                    ["res-out-of-range@1:5", "read-before-store@1:3"], [], 2)
+        self._record_check("P.6", results == [expected] * 2, f"results: {results}",
+                           "Lines that fail to parse leave no issues, stores or RES history behind")
+
+        def fault(operand, token):
+            raise RuntimeError("injected fault")
+
+        lines = ["( 1 X )", "( 1 RES ) )", "( 1 RES )", "( X 1 + )"]
+        plain = self._check_program(lines)[0]
+        results = []
+        for engine in (self.parser, CompressedTableParser()):
+            faulty = SemanticChecker()
+            faulty._check_res = fault
+            verdicts, checker = self._check_program(lines, engine, faulty)
+            results.append((verdicts, findings(checker), sorted(checker.stored), checker.history))
+        expected = ([True, False, True, True], ["checker-error@1:5"], ['X'], 3)
+        self._record_check("P.7", plain == expected[0] and results == [expected] * 2, f"results: {results}",
+                           "A fault inside the checker never changes the verdict and is dropped with a failed line")
+
+        passed = sum(1 for r in self.test_results if r['name'].startswith('P.') and r['passed'])
+        print(f"\n📊 SEMANTIC PRE-CHECK RESULTS: {passed}/7 passed")
+        print("=" * 80)
+
     def run_comprehensive_testing(self, test_file_path: str = "/home/waifuisalie/Documents/pls_RA2/RA2_1/teste2.txt"):
         """Run both vigorous and real-world tests"""
         print("🔥 COMPREHENSIVE GRAMMAR TESTING SUITE")
@@ -794,15 +851,31 @@ def main():
     runner = GrammarTestRunner()
 
     # Option to run comprehensive tests (both vigorous + real-world)
-    import sys
     if len(sys.argv) > 1 and sys.argv[1] == "--comprehensive":
         runner.run_comprehensive_testing()
     elif len(sys.argv) > 1 and sys.argv[1] == "--real-world":
         runner.run_real_world_tests()
+    elif len(sys.argv) > 1 and sys.argv[1] == "--errors":
+        runner.run_error_message_tests()
+    elif len(sys.argv) > 1 and sys.argv[1] == "--startup":
+        runner.run_startup_tests()
+    elif len(sys.argv) > 1 and sys.argv[1] == "--scaling":
+        runner.run_scaling_tests()
+    elif len(sys.argv) > 1 and sys.argv[1] == "--grammar":
+        runner.run_grammar_spec_tests()
+    elif len(sys.argv) > 1 and sys.argv[1] == "--compressed":
+        runner.run_compressed_table_tests()
+    elif len(sys.argv) > 1 and sys.argv[1] == "--semantic":
+        runner.run_semantic_tests()
     else:
         # Default: run original vigorous tests only
         print("🎯 Running Original Vigorous Tests")
-        print("💡 Use --comprehensive for both test suites or --real-world for real-world tests only")
+        print("💡 Use --comprehensive for both test suites, --real-world for real-world tests only")
+        print("💡 --errors for the syntax error messages")
+        print("💡 --startup for the validator CLI startup budget, --scaling for limits and linear-time checks")
+        print("💡 --grammar for the spec loader and compiled-grammar registry")
+        print("💡 --compressed for the compressed parse table engine")
+        print("💡 or --semantic for the semantic pre-checks")
         print("=" * 80)
         runner.run_all_tests()
 
@@ -0,0 +1,825 @@
+#!/usr/bin/env python3
+"""
+LL(1) Parser Core
+Lexer, grammar, compiled-grammar registry and LL(1) parser for the PDF compliant grammar
+
+Kept free of the test runner and report code, and of heavy imports (typing, dataclasses,
+hashlib, json are only loaded when actually needed) so short-lived CLI invocations stay fast.
+A compiled parsing table is cached on disk and reused while this file is unchanged.
+"""
+
+from __future__ import annotations
+
+import os
+import marshal
+from enum import Enum
+
+# typing is only needed by type checkers; importing it at runtime costs startup time
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import List, Dict, Tuple, Optional, Set
+
+# Number of tokens shown on each side of a syntax error, and the width each token is clipped to
+ERROR_CONTEXT_TOKENS = 4
+ERROR_CONTEXT_VALUE_WIDTH = 16
+
+# Default resource limits (see ParseLimits); each nesting level costs two parser stack slots
+DEFAULT_MAX_STACK_DEPTH = 10_000
+DEFAULT_MAX_TOKENS_PER_LINE = 100_000
+DEFAULT_MAX_INPUT_BYTES = 10 * 1024 * 1024
+
+class TokenType(Enum):
+    # Basic symbols
+    NUMERO_REAL = "NUMERO_REAL"
+    VARIAVEL = "VARIAVEL"
+    ABRE_PARENTESES = "ABRE_PARENTESES"
+    FECHA_PARENTESES = "FECHA_PARENTESES"
+    RES = "RES"
+    FIM = "FIM"
+
+    # Arithmetic operators (PDF compliant)
+    SOMA = "SOMA"
+    SUBTRACAO = "SUBTRACAO"
+    MULTIPLICACAO = "MULTIPLICACAO"
+    DIVISAO_REAL = "DIVISAO_REAL"        # | operator (PDF compliant)
+    DIVISAO_INTEIRA = "DIVISAO_INTEIRA"  # / operator (PDF compliant)
+    RESTO = "RESTO"
+    POTENCIA = "POTENCIA"
+
+    # Relational operators
+    MENOR = "MENOR"
+    MAIOR = "MAIOR"
+    MENOR_IGUAL = "MENOR_IGUAL"
+    MAIOR_IGUAL = "MAIOR_IGUAL"
+    IGUAL = "IGUAL"
+    DIFERENTE = "DIFERENTE"
+
+    # Logical operators
+    AND = "AND"
+    OR = "OR"
+    NOT = "NOT"
+
+    # Control structure keywords
+    FOR = "FOR"
+    WHILE = "WHILE"
+    IFELSE = "IFELSE"
+
+class Token:
+    __slots__ = ('type', 'value', 'line', 'column')
+
+    def __init__(self, type: TokenType, value: str, line: int = 1, column: int = 1):
+        self.type = type
+        self.value = value
+        self.line = line
+        self.column = column
+
+    def __repr__(self) -> str:
+        return f"Token(type={self.type}, value={self.value!r}, line={self.line}, column={self.column})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Token):
+            return NotImplemented
+        return (self.type, self.value, self.line, self.column) == (other.type, other.value, other.line, other.column)
+
+class LimitExceededError(SyntaxError):
+    """Input rejected because it exceeds a configured ParseLimits bound"""
+
+class ParseLimits:
+    """Resource limits for untrusted input; None disables a limit"""
+    __slots__ = ('max_stack_depth', 'max_tokens_per_line', 'max_input_bytes')
+
+    def __init__(self, max_stack_depth: Optional[int] = DEFAULT_MAX_STACK_DEPTH,
+                 max_tokens_per_line: Optional[int] = DEFAULT_MAX_TOKENS_PER_LINE,
+                 max_input_bytes: Optional[int] = DEFAULT_MAX_INPUT_BYTES):
+        self.max_stack_depth = max_stack_depth
+        self.max_tokens_per_line = max_tokens_per_line
+        self.max_input_bytes = max_input_bytes
+
+    def __repr__(self) -> str:
+        return (f"ParseLimits(max_stack_depth={self.max_stack_depth}, "
+                f"max_tokens_per_line={self.max_tokens_per_line}, max_input_bytes={self.max_input_bytes})")
+
+class PDFCompliantLexer:
+    """PDF compliant lexer with correct division operator tokenization"""
+
+    def __init__(self, limits: Optional[ParseLimits] = None):
+        self.limits = limits if limits is not None else ParseLimits()
+
+        # PDF compliant token mapping
+        self.token_mapping = {
+            '(': TokenType.ABRE_PARENTESES,
+            ')': TokenType.FECHA_PARENTESES,
+            '+': TokenType.SOMA,
+            '-': TokenType.SUBTRACAO,
+            '*': TokenType.MULTIPLICACAO,
+            '|': TokenType.DIVISAO_REAL,      # PDF: Real division (pipe symbol)
+            '/': TokenType.DIVISAO_INTEIRA,   # PDF: Integer division (slash symbol)
+            '%': TokenType.RESTO,
+            '^': TokenType.POTENCIA,
+            '>': TokenType.MAIOR,
+            '<': TokenType.MENOR,
+            '>=': TokenType.MAIOR_IGUAL,
+            '<=': TokenType.MENOR_IGUAL,
+            '==': TokenType.IGUAL,
+            '!=': TokenType.DIFERENTE,
+            '&&': TokenType.AND,
+            '||': TokenType.OR,
+            '!': TokenType.NOT,
+            'AND': TokenType.AND,
+            'OR': TokenType.OR,
+            'NOT': TokenType.NOT,
+            'FOR': TokenType.FOR,
+            'WHILE': TokenType.WHILE,
+            'IFELSE': TokenType.IFELSE,
+            'RES': TokenType.RES,
+        }
+
+    def tokenize(self, text: str) -> List[Token]:
+        """Tokenize input text according to PDF specification"""
+        limits = self.limits
+        if limits.max_input_bytes is not None and len(text) * 4 > limits.max_input_bytes:
+            # Only encode when the character count alone cannot rule the input in
+            size = len(text.encode('utf-8'))
+            if size > limits.max_input_bytes:
+                raise LimitExceededError(
+                    f"Input is {size} bytes, exceeds max_input_bytes={limits.max_input_bytes}")
+        max_line_tokens = limits.max_tokens_per_line
+
+        tokens = []
+        i = 0
+        line = 1
+        column = 1
+        depth = 0           # Parenthesis depth, a LINHA starts at depth 0
+        line_start = 0      # Index in tokens of the current LINHA's opening token
+
+        while i < len(text):
+            # Skip whitespace
+            if text[i].isspace():
+                if text[i] == '\n':
+                    line += 1
+                    column = 1
+                else:
+                    column += 1
+                i += 1
+                continue
+
+            # Check for two-character operators first
+            two_char = text[i:i+2]
+            if len(two_char) == 2 and two_char in self.token_mapping:
+                token_type, value = self.token_mapping[two_char], two_char
+
+            # Single character operators and parentheses
+            elif text[i] in self.token_mapping:
+                token_type, value = self.token_mapping[text[i]], text[i]
+
+            # Numbers (integers or floats)
+            elif text[i].isdigit():
+                end = i
+                while end < len(text) and (text[end].isdigit() or text[end] == '.'):
+                    end += 1
+                token_type, value = TokenType.NUMERO_REAL, text[i:end]
+
+            # Variables and keywords (uppercase sequences)
+            elif text[i].isupper():
+                end = i
+                while end < len(text) and text[end].isupper():
+                    end += 1
+                value = text[i:end]
+
+                # Check if it's a keyword
+                token_type = self.token_mapping.get(value, TokenType.VARIAVEL)
+
+            else:
+                # Unrecognized character
+                raise SyntaxError(f"Unrecognized character '{text[i]}' at line {line}, column {column}")
+
+            if token_type == TokenType.ABRE_PARENTESES:
+                if depth == 0:
+                    line_start = len(tokens)
+                depth += 1
+            elif token_type == TokenType.FECHA_PARENTESES and depth > 0:
+                depth -= 1
+
+            tokens.append(Token(token_type, value, line, column))
+            i += len(value)
+            column += len(value)
+
+            if max_line_tokens is not None and len(tokens) - line_start > max_line_tokens:
+                opening = tokens[line_start]
+                raise LimitExceededError(
+                    f"LINHA starting at line {opening.line}, column {opening.column} exceeds "
+                    f"max_tokens_per_line={max_line_tokens} (at line {line}, column {column - len(value)})")
+
+        # Add end-of-file marker
+        tokens.append(Token(TokenType.FIM, "FIM", line, column))
+        return tokens
+
+# PDF compliant grammar, mirrors the EBNF block of Updated_LL1_Grammar_PDF_Compliant.md
+# (kept in sync by grammar_vigorous_test.py --grammar)
+PDF_COMPLIANT_GRAMMAR = {
+    'PROGRAM': [['LINHA', 'PROGRAM_PRIME']],
+    'PROGRAM_PRIME': [['LINHA', 'PROGRAM_PRIME'], ['EPSILON']],
+    'LINHA': [['ABRE_PARENTESES', 'CONTENT', 'FECHA_PARENTESES']],
+    'CONTENT': [
+        ['NUMERO_REAL', 'AFTER_NUM'],
+        ['VARIAVEL', 'AFTER_VAR'],
+        ['ABRE_PARENTESES', 'EXPR', 'FECHA_PARENTESES', 'AFTER_EXPR'],
+        ['FOR', 'FOR_STRUCT'],
+        ['WHILE', 'WHILE_STRUCT'],
+        ['IFELSE', 'IFELSE_STRUCT']
+    ],
+    'AFTER_NUM': [
+        ['NUMERO_REAL', 'OPERATOR'],
+        ['VARIAVEL', 'AFTER_VAR_OP'],
+        ['ABRE_PARENTESES', 'EXPR', 'FECHA_PARENTESES', 'OPERATOR'],
+        ['NUMERO_REAL', 'OPERATOR', 'VARIAVEL'],  # Store arithmetic result in memory
+        ['VARIAVEL', 'OPERATOR', 'VARIAVEL'],     # Store arithmetic result in memory
+        ['VARIAVEL'],                             # Store number in memory (no operator)
+        ['RES']
+    ],
+    'AFTER_VAR_OP': [['OPERATOR'], ['EPSILON']],
+    'AFTER_VAR': [
+        ['NUMERO_REAL', 'OPERATOR'],
+        ['VARIAVEL', 'OPERATOR'],
+        ['ABRE_PARENTESES', 'EXPR', 'FECHA_PARENTESES', 'OPERATOR'],
+        ['EPSILON']
+    ],
+    'AFTER_EXPR': [
+        ['NUMERO_REAL', 'OPERATOR'],
+        ['VARIAVEL', 'AFTER_VAR_OP'],
+        ['ABRE_PARENTESES', 'EXPR', 'FECHA_PARENTESES', 'OPERATOR'],
+        ['UNARY_OP']                              # Unary operator support
+    ],
+    'EXPR': [
+        ['NUMERO_REAL', 'AFTER_NUM'],
+        ['VARIAVEL', 'AFTER_VAR'],
+        ['ABRE_PARENTESES', 'EXPR', 'FECHA_PARENTESES', 'AFTER_EXPR']
+    ],
+    'OPERATOR': [['ARITH_OP'], ['COMP_OP'], ['LOGIC_OP']],
+    'ARITH_OP': [
+        ['SOMA'], ['SUBTRACAO'], ['MULTIPLICACAO'],
+        ['DIVISAO_REAL'], ['DIVISAO_INTEIRA'],  # PDF compliant division
+        ['RESTO'], ['POTENCIA']
+    ],
+    'COMP_OP': [
+        ['MENOR'], ['MAIOR'], ['IGUAL'],
+        ['MENOR_IGUAL'], ['MAIOR_IGUAL'], ['DIFERENTE']
+    ],
+    'LOGIC_OP': [['AND'], ['OR'], ['NOT']],
+    'UNARY_OP': [['NOT']],                       # Unary logical operators
+    'FOR_STRUCT': [['NUMERO_REAL', 'NUMERO_REAL', 'VARIAVEL', 'LINHA']],
+    'WHILE_STRUCT': [['ABRE_PARENTESES', 'EXPR', 'FECHA_PARENTESES', 'LINHA']],
+    'IFELSE_STRUCT': [['ABRE_PARENTESES', 'EXPR', 'FECHA_PARENTESES', 'LINHA', 'LINHA']]
+}
+
+class CompiledGrammar:
+    """Parsing table and symbol IDs computed once per distinct grammar"""
+    __slots__ = ('grammar_hash', 'grammar', 'start_symbol', 'parsing_table', 'expected_terminals', 'symbol_ids')
+
+    def __init__(self, grammar_hash: str, grammar: Dict[str, List[List[str]]], start_symbol: str,
+                 parsing_table: Dict[Tuple[str, str], List[str]], expected_terminals: Dict[str, Tuple[str, ...]],
+                 symbol_ids: Dict[str, int]):
+        self.grammar_hash = grammar_hash
+        self.grammar = grammar
+        self.start_symbol = start_symbol
+        self.parsing_table = parsing_table
+        self.expected_terminals = expected_terminals    # non-terminal -> sorted terminals it has entries for
+        self.symbol_ids = symbol_ids
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+# Compiled grammars keyed by grammar hash, shared by every LL1Parser in the process
+GRAMMAR_REGISTRY: Dict[str, CompiledGrammar] = {}
+
+# Precompiled parsing table for the default grammar, rebuilt whenever this file changes
+PRECOMPILED_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '__pycache__',
+                                      'll1_parsing_table.marshal')
+PRECOMPILED_TABLE_FORMAT = 2
+
+def grammar_hash(grammar: Dict[str, List[List[str]]]) -> str:
+    """Stable hash of a grammar; rule and alternative order are significant"""
+    import json
+    import hashlib
+    return hashlib.sha256(json.dumps(grammar, separators=(',', ':')).encode('utf-8')).hexdigest()
+
+def _precompiled_stamp() -> Tuple[int, int, int]:
+    stat = os.stat(__file__)
+    return (PRECOMPILED_TABLE_FORMAT, stat.st_mtime_ns, stat.st_size)
+
+def load_precompiled_grammar(path: str = PRECOMPILED_TABLE_PATH) -> Optional[CompiledGrammar]:
+    """Load the default grammar's compiled table from disk, or None if missing or stale"""
+    try:
+        with open(path, 'rb') as f:
+            data = marshal.load(f)
+        if data['stamp'] != _precompiled_stamp():
+            return None
+        return CompiledGrammar(**data['compiled'])
+    except (OSError, EOFError, ValueError, TypeError, KeyError):
+        return None
+
+def save_precompiled_grammar(compiled: CompiledGrammar, path: str = PRECOMPILED_TABLE_PATH) -> bool:
+    """Write a compiled table for load_precompiled_grammar; failures (read-only tree) are not fatal"""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as f:
+            marshal.dump({'stamp': _precompiled_stamp(), 'compiled': compiled.to_dict()}, f)
+        os.replace(temp_path, path)
+        return True
+    except OSError:
+        return False
+
+def error_context(tokens: List[Token], index: int) -> str:
+    """Bounded snippet of the tokens around index, with the offending token marked"""
+    start = max(0, index - ERROR_CONTEXT_TOKENS)
+    end = min(len(tokens), index + ERROR_CONTEXT_TOKENS + 1)
+    parts = []
+    for i in range(start, end):
+        if tokens[i].type == TokenType.FIM:
+            if i == index:
+                parts.append(">><end of input><<")
+            break
+        value = tokens[i].value
+        if len(value) > ERROR_CONTEXT_VALUE_WIDTH:
+            value = value[:ERROR_CONTEXT_VALUE_WIDTH] + "…"
+        parts.append(f">>{value}<<" if i == index else value)
+    snippet = " ".join(parts)
+    if start > 0:
+        snippet = "... " + snippet
+    if end < len(tokens) and tokens[end].type != TokenType.FIM:
+        snippet += " ..."
+    return snippet
+
+def format_syntax_error(tokens: List[Token], index: int, expected: str, context: str = "") -> str:
+    """Format a syntax error located at tokens[index]"""
+    if tokens:
+        token = tokens[min(index, len(tokens) - 1)]
+        found = "end of input" if token.type == TokenType.FIM else f"{token.type.value} '{token.value}'"
+        location = f"line {token.line}, column {token.column}"
+    else:
+        found = "end of input"
+        location = "line 1, column 1"
+    where = f" in {context}" if context else ""
+    return (f"Syntax error at {location}: unexpected {found}{where}; "
+            f"expected {expected}. Near: {error_context(tokens, index)}")
+
+def format_limit_error(tokens: List[Token], index: int, depth: int, limits: ParseLimits) -> str:
+    """Format a nesting-limit error located at tokens[index]"""
+    token = tokens[min(index, len(tokens) - 1)]
+    return (f"Nesting limit exceeded at line {token.line}, column {token.column}: parser stack depth "
+            f"{depth} exceeds max_stack_depth={limits.max_stack_depth}. "
+            f"Near: {error_context(tokens, index)}")
+
+def expected_one_of(terminals: Tuple[str, ...]) -> str:
+    """The 'expected' part of a syntax error for a non-terminal's sorted expected terminals"""
+    return f"one of: {', '.join(terminals)}"
+
+class LL1Parser:
+    """LL(1) parser implementing the PDF compliant grammar"""
+
+    def __init__(self, grammar: Optional[Dict[str, List[List[str]]]] = None,
+                 compiled: Optional[CompiledGrammar] = None, limits: Optional[ParseLimits] = None):
+        self.limits = limits if limits is not None else ParseLimits()
+        if compiled is None:
+            # Defaults to the PDF compliant grammar from Updated_LL1_Grammar_PDF_Compliant.md
+            self.grammar = grammar if grammar is not None else PDF_COMPLIANT_GRAMMAR
+            self.start_symbol = next(iter(self.grammar))
+
+            key = grammar_hash(self.grammar)
+            compiled = GRAMMAR_REGISTRY.get(key)
+            if compiled is None:
+                compiled = self._compile(key)
+                GRAMMAR_REGISTRY[key] = compiled
+        else:
+            compiled = GRAMMAR_REGISTRY.setdefault(compiled.grammar_hash, compiled)
+
+        self.compiled = compiled
+        self.grammar = compiled.grammar
+        self.start_symbol = compiled.start_symbol
+        self.parsing_table = compiled.parsing_table
+
+        # Expected terminals per non-terminal, used for error reporting
+        self.expected_terminals = compiled.expected_terminals
+
+    @classmethod
+    def from_spec(cls, path: str, terminal_aliases: Optional[Dict[str, str]] = None) -> 'LL1Parser':
+        """Build a parser from the EBNF block of a Markdown grammar spec"""
+        from grammar_loader import load_grammar_from_markdown
+        return cls(load_grammar_from_markdown(path, terminal_aliases))
+
+    @classmethod
+    def precompiled(cls, limits: Optional[ParseLimits] = None) -> 'LL1Parser':
+        """Parser for the default grammar, loading its table from disk instead of recomputing it"""
+        compiled = load_precompiled_grammar()
+        if compiled is None:
+            parser = cls(limits=limits)
+            save_precompiled_grammar(parser.compiled)
+            return parser
+        return cls(compiled=compiled, limits=limits)
+
+    def _compile(self, key: str) -> CompiledGrammar:
+        """Build the parsing table, expected-terminal lists and symbol IDs for self.grammar"""
+        # The registry outlives the caller's dict; a later change to it must not reach the shared entry
+        self.grammar = {non_terminal: [list(production) for production in productions]
+                        for non_terminal, productions in self.grammar.items()}
+        self.parsing_table = self._build_parsing_table()
+        return CompiledGrammar(
+            grammar_hash=key,
+            grammar=self.grammar,
+            start_symbol=self.start_symbol,
+            parsing_table=self.parsing_table,
+            expected_terminals=self._build_expected_terminals(),
+            symbol_ids=self._build_symbol_ids(),
+        )
+
+    def _terminals(self) -> List[str]:
+        """All terminals: the lexer's token types, then any extra symbols the grammar uses"""
+        terminals = [token_type.value for token_type in TokenType]
+        known = set(terminals)
+        for productions in self.grammar.values():
+            for production in productions:
+                for symbol in production:
+                    if symbol not in self.grammar and symbol != 'EPSILON' and symbol not in known:
+                        terminals.append(symbol)
+                        known.add(symbol)
+        return terminals
+
+    def _build_symbol_ids(self) -> Dict[str, int]:
+        """Dense integer IDs: terminals first, then non-terminals in grammar order"""
+        symbols = self._terminals() + list(self.grammar)
+        return {symbol: symbol_id for symbol_id, symbol in enumerate(symbols)}
+
+    def _calculate_first_sets(self) -> Dict[str, Set[str]]:
+        """Calculate FIRST sets for all symbols"""
+        first_sets = {}
+
+        # Initialize FIRST sets
+        for non_terminal in self.grammar:
+            first_sets[non_terminal] = set()
+
+        # Add terminals
+        for terminal in self._terminals():
+            first_sets[terminal] = {terminal}
+        first_sets['EPSILON'] = {'EPSILON'}
+
+        # Calculate FIRST sets using fixed-point algorithm
+        changed = True
+        while changed:
+            changed = False
+            for non_terminal in self.grammar:
+                old_size = len(first_sets[non_terminal])
+
+                for production in self.grammar[non_terminal]:
+                    if production == ['EPSILON']:
+                        first_sets[non_terminal].add('EPSILON')
+                        continue
+
+                    for symbol in production:
+                        first_sets[non_terminal].update(first_sets[symbol] - {'EPSILON'})
+                        if 'EPSILON' not in first_sets[symbol]:
+                            break
+                    else:
+                        # All symbols can derive epsilon
+                        first_sets[non_terminal].add('EPSILON')
+
+                if len(first_sets[non_terminal]) > old_size:
+                    changed = True
+
+        return first_sets
+
+    def _calculate_follow_sets(self, first_sets: Dict[str, Set[str]]) -> Dict[str, Set[str]]:
+        """Calculate FOLLOW sets for all non-terminals"""
+        follow_sets = {}
+
+        # Initialize FOLLOW sets
+        for non_terminal in self.grammar:
+            follow_sets[non_terminal] = set()
+
+        # Start symbol gets end-of-input marker
+        follow_sets[self.start_symbol] = {'FIM'}
+
+        # Calculate FOLLOW sets using fixed-point algorithm
+        changed = True
+        while changed:
+            changed = False
+
+            for non_terminal in self.grammar:
+                for production in self.grammar[non_terminal]:
+                    for i, symbol in enumerate(production):
+                        if symbol in self.grammar:  # Is non-terminal
+                            old_size = len(follow_sets[symbol])
+
+                            # Add FIRST of everything after this symbol
+                            if i + 1 < len(production):
+                                for j in range(i + 1, len(production)):
+                                    follow_sets[symbol].update(first_sets[production[j]] - {'EPSILON'})
+                                    if 'EPSILON' not in first_sets[production[j]]:
+                                        break
+                                else:
+                                    # All following symbols can derive epsilon
+                                    follow_sets[symbol].update(follow_sets[non_terminal])
+                            else:
+                                # Last symbol in production
+                                follow_sets[symbol].update(follow_sets[non_terminal])
+
+                            if len(follow_sets[symbol]) > old_size:
+                                changed = True
+
+        return follow_sets
+
+    def _build_parsing_table(self) -> Dict[Tuple[str, str], List[str]]:
+        """Build LL(1) parsing table"""
+        first_sets = self._calculate_first_sets()
+        follow_sets = self._calculate_follow_sets(first_sets)
+
+        parsing_table = {}
+
+        for non_terminal in self.grammar:
+            for production in self.grammar[non_terminal]:
+                # Add entries for all terminals in FIRST(production)
+                if production == ['EPSILON']:
+                    # Add entries for all terminals in FOLLOW(non_terminal)
+                    for terminal in follow_sets[non_terminal]:
+                        if terminal != 'EPSILON':
+                            parsing_table[(non_terminal, terminal)] = production
+                else:
+                    for symbol in production:
+                        for terminal in first_sets[symbol]:
+                            if terminal != 'EPSILON':
+                                parsing_table[(non_terminal, terminal)] = production
+                        if 'EPSILON' not in first_sets[symbol]:
+                            break
+                    else:
+                        # All symbols can derive epsilon
+                        for terminal in follow_sets[non_terminal]:
+                            if terminal != 'EPSILON':
+                                parsing_table[(non_terminal, terminal)] = production
+
+        return parsing_table
+
+    def _build_expected_terminals(self) -> Dict[str, Tuple[str, ...]]:
+        """Precompute the sorted expected terminals of every non-terminal from the table"""
+        expected = {non_terminal: set() for non_terminal in self.grammar}
+        for non_terminal, terminal in self.parsing_table:
+            expected[non_terminal].add(terminal)
+        return {non_terminal: tuple(sorted(terminals)) for non_terminal, terminals in expected.items()}
+
+    def parse(self, tokens: List[Token], checker: Optional[SemanticChecker] = None) -> Tuple[bool, List[str], str]:
+        """
+        Parse tokens using LL(1) parser
+        Matched terminals are fed to checker, if given, in the same pass
+        Returns: (success, derivation_sequence, error_message)
+        """
+        if checker is not None:
+            checker.begin(tokens)
+        try:
+            stack = ['FIM', self.start_symbol]  # Bottom-up: FIM, then start symbol
+            input_tokens = [token.type.value for token in tokens]
+            input_index = 0
+            derivation = []
+            max_depth = self.limits.max_stack_depth
+            if max_depth is None:
+                max_depth = float('inf')
+
+            while len(stack) > 1:  # While not just FIM on stack
+                top = stack[-1]
+                current_input = input_tokens[input_index] if input_index < len(input_tokens) else 'FIM'
+
+                if top == current_input:
+                    # Terminal match
+                    stack.pop()
+                    if checker is not None:
+                        try:
+                            checker.match(tokens[input_index])
+                        except Exception as e:
+                            # A pre-check fault must never change the parse verdict; the checker
+                            # ignores the rest of this input and its issue is kept only on success
+                            checker.abort(tokens[input_index], e)
+                    input_index += 1
+                    derivation.append(f"Match terminal: {top}")
+                elif top in self.grammar:
+                    # Non-terminal - use parsing table
+                    table_key = (top, current_input)
+                    if table_key in self.parsing_table:
+                        production = self.parsing_table[table_key]
+                        stack.pop()
+
+                        if production != ['EPSILON']:
+                            # Add production symbols in reverse order
+                            for symbol in reversed(production):
+                                stack.append(symbol)
+                            if len(stack) > max_depth:
+                                return False, derivation, format_limit_error(tokens, input_index, len(stack),
+                                                                             self.limits)
+
+                        derivation.append(f"{top} → {' '.join(production)}")
+                    else:
+                        expected = expected_one_of(self.expected_terminals[top])
+                        return False, derivation, format_syntax_error(tokens, input_index, expected, top)
+                else:
+                    # Terminal on stack does not match the current input
+                    return False, derivation, format_syntax_error(tokens, input_index, top)
+
+            # Check if all input consumed
+            if input_index < len(input_tokens) - 1:  # -1 for FIM token
+                return False, derivation, format_syntax_error(tokens, input_index, "end of input")
+
+            if checker is not None:
+                checker.commit()
+            return True, derivation, "Parse successful"
+
+        except Exception as e:
+            return False, [], f"Parse error: {type(e).__name__}: {str(e)}"
+
+class SemanticIssue:
+    """A semantic pre-check finding, located at the token that triggered it"""
+    __slots__ = ('kind', 'line', 'column', 'message')
+
+    def __init__(self, kind: str, token: Token, message: str):
+        self.kind = kind
+        self.line = token.line
+        self.column = token.column
+        self.message = message
+
+    def __str__(self) -> str:
+        return f"line {self.line}, column {self.column}: {self.message}"
+
+    def __repr__(self) -> str:
+        return f"SemanticIssue({self.kind!r}, line={self.line}, column={self.column}, message={self.message!r})"
+
+class _Group:
+    """Per-parenthesis bookkeeping for SemanticChecker"""
+    __slots__ = ('kind', 'count', 'pending', 'previous', 'real_literal')
+
+    def __init__(self):
+        self.kind = None            # Token type of the first element (FOR, WHILE, ...)
+        self.count = 0              # Direct elements so far; a nested group counts as one
+        self.pending = None         # VARIAVEL whose read/store role depends on what follows
+        self.previous = None        # Previous direct token, None after a nested group
+        self.real_literal = None    # First direct NUMERO_REAL operand with a decimal point
+
+class SemanticChecker:
+    """
+    Semantic pre-checks fed by the parser with every matched terminal, so they cost no extra pass
+
+    Pass one checker to successive parse() calls to check a multi-line program: stored variables
+    and the RES history carry over, while histogram is reset per parse. Findings are held back
+    until the parser calls commit() on success, so a line that fails to parse leaves no trace,
+    not even the checker-error issue of a pre-check fault (see abort()).
+    Tracks:
+      - token-type histogram of the last parsed input; tokens after a syntax error are counted
+        from the token list the first time histogram is read
+      - variables read before any store ('( X )', operands) vs stores ('( V X )', '( ( EXPR ) X )', FOR variable)
+      - '( N RES )' where N exceeds the number of completed lines
+      - integer division '/' with a real literal operand
+    """
+
+    def __init__(self):
+        self._histogram: Dict[str, int] = {}
+        self._tokens: Optional[List[Token]] = None     # Input whose unmatched tail is not yet counted
+        self._matched = 0
+        self.issues: List[SemanticIssue] = []
+        self.stored: Set[str] = set()
+        self.history = 0
+        self._reported: Set[str] = set()
+        self._groups: List[Optional[_Group]] = []      # None for groups opened after abort()
+        self._aborted = False
+        # Findings of the current parse, moved to the public state by commit()
+        self._pending_issues: List[SemanticIssue] = []
+        self._pending_stored: Set[str] = set()
+        self._pending_reported: Set[str] = set()
+        self._pending_lines = 0
+
+    def begin(self, tokens: Optional[List[Token]] = None):
+        """Start a new parse of tokens: reset the histogram and drop anything left by a failed parse"""
+        self._histogram = {}
+        self._tokens = tokens
+        self._matched = 0
+        self._groups = []
+        self._aborted = False
+        self._discard()
+
+    def _discard(self):
+        self._pending_issues = []
+        self._pending_stored = set()
+        self._pending_reported = set()
+        self._pending_lines = 0
+
+    def commit(self):
+        """The parse succeeded: keep its issues, stores and completed lines"""
+        self.issues.extend(self._pending_issues)
+        self.stored |= self._pending_stored
+        self._reported |= self._pending_reported
+        self.history += self._pending_lines
+        self._discard()
+
+    @property
+    def histogram(self) -> Dict[str, int]:
+        """Token-type counts of the whole last input, including any tail the parser did not reach"""
+        if self._tokens is not None:
+            histogram = self._histogram
+            for token in self._tokens[self._matched:]:
+                if token.type != TokenType.FIM:
+                    histogram[token.type.value] = histogram.get(token.type.value, 0) + 1
+            self._tokens = None
+        return self._histogram
+
+    def abort(self, token: Token, error: Exception):
+        """Record that checking stopped at token; further matches of this parse are ignored"""
+        self._aborted = True
+        self._pending_issues.append(SemanticIssue('checker-error', token,
+                                                  f"semantic checks aborted: {type(error).__name__}: {error}"))
+
+    def _read(self, token: Token):
+        name = token.value
+        if name in self.stored or name in self._pending_stored:
+            return
+        if name not in self._reported and name not in self._pending_reported:
+            self._pending_reported.add(name)
+            self._pending_issues.append(SemanticIssue('read-before-store', token,
+                                                      f"variable '{name}' read before any store"))
+
+    def _element(self, group: _Group):
+        """A new direct element follows, so a pending variable was an operand"""
+        if group.pending is not None:
+            self._read(group.pending)
+            group.pending = None
+        group.count += 1
+
+    def match(self, token: Token):
+        token_type = token.type
+        if self._aborted:
+            # Only follow the nesting, so the completed lines still count towards the RES history
+            if token_type == TokenType.ABRE_PARENTESES:
+                self._groups.append(None)
+            elif token_type == TokenType.FECHA_PARENTESES and self._groups:
+                self._groups.pop()
+                if not self._groups:
+                    self._pending_lines += 1
+            return
+        self._matched += 1
+        self._histogram[token_type.value] = self._histogram.get(token_type.value, 0) + 1
+        groups = self._groups
+
+        if token_type == TokenType.ABRE_PARENTESES:
+            if groups:
+                self._element(groups[-1])
+                groups[-1].previous = None
+            groups.append(_Group())
+            return
+
+        if token_type == TokenType.FECHA_PARENTESES:
+            if not groups:
+                return
+            group = groups.pop()
+            if group.pending is not None:
+                if group.count >= 2:
+                    self._pending_stored.add(group.pending.value)
+                else:
+                    self._read(group.pending)
+            if not groups:
+                self._pending_lines += 1
+            return
+
+        if not groups:
+            return
+        group = groups[-1]
+        self._element(group)
+        if group.count == 1:
+            group.kind = token_type
+
+        if token_type == TokenType.VARIAVEL:
+            if group.kind == TokenType.FOR and group.count == 4:
+                self._pending_stored.add(token.value)    # ( FOR start end VAR LINHA )
+            else:
+                group.pending = token
+        elif token_type == TokenType.NUMERO_REAL:
+            if group.real_literal is None and '.' in token.value:
+                group.real_literal = token
+        elif token_type == TokenType.RES:
+            self._check_res(group.previous, token)
+        elif token_type == TokenType.DIVISAO_INTEIRA and group.real_literal is not None:
+            self._pending_issues.append(SemanticIssue('integer-division-real', token,
+                                             f"integer division '/' applied to real literal {group.real_literal.value}"))
+        group.previous = token
+
+    def _check_res(self, operand: Optional[Token], token: Token):
+        if operand is None or operand.type != TokenType.NUMERO_REAL:
+            return
+        # Compare digit strings; converting an arbitrarily long literal could overflow
+        shown = operand.value
+        if len(shown) > ERROR_CONTEXT_VALUE_WIDTH:
+            shown = shown[:ERROR_CONTEXT_VALUE_WIDTH] + "…"
+        whole, _, fraction = operand.value.partition('.')
+        whole = whole.lstrip('0')
+        if fraction.strip('0') or not whole:
+            self._pending_issues.append(SemanticIssue('res-out-of-range', token,
+                                                      f"RES offset {shown} is not a positive whole number of lines"))
+            return
+        lines = self.history + self._pending_lines
+        history = str(lines)
+        if (len(whole), whole) > (len(history), history):
+            self._pending_issues.append(SemanticIssue('res-out-of-range', token,
+                                                      f"RES refers {shown} lines back but only {lines} "
+                                                      f"line(s) precede it"))
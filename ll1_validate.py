@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+LL(1) Expression Validator CLI
+Fast entry point for build scripts: validate expression files against the PDF compliant grammar
+
+Only ll1_core is imported for validation, and it loads the precompiled parsing table.
+The test suites and reports are imported only when their mode is requested.
+
+Usage:
+    python ll1_validate.py FILE [FILE ...]     # validate every expression line ('-' reads stdin)
+    python ll1_validate.py --semantic FILE ... # also report semantic pre-check warnings per file
+    python ll1_validate.py --compile           # (re)build the precompiled parsing table
+    python ll1_validate.py --tests             # vigorous grammar test suite (also --comprehensive, --real-world)
+    python ll1_validate.py --differential ...  # differential harness, remaining args are passed through
+
+Exit status: 0 when every expression parses, 1 when any fails, 2 on usage or I/O errors.
+"""
+
+import sys
+
+USAGE = ("usage: ll1_validate.py [--semantic] FILE ... | --compile | --tests | --comprehensive | --real-world"
+         " | --differential ...")
+
+
+def validate_lines(lines, source: str, lexer, parser, checker=None) -> int:
+    """Validate one expression per line (blank lines and # comments skipped); returns the failure count"""
+    failures = 0
+    reported = 0
+    for line_number, line in enumerate(lines, 1):
+        expression = line.split('#', 1)[0].strip()
+        if not expression:
+            continue
+        try:
+            success, _, message = parser.parse(lexer.tokenize(expression), checker)
+        except SyntaxError as e:
+            success, message = False, str(e)
+        if not success:
+            failures += 1
+            print(f"{source}:{line_number}: {message}")
+        if checker is not None:
+            for issue in checker.issues[reported:]:
+                print(f"{source}:{line_number}: warning: {issue.message} (column {issue.column})")
+            reported = len(checker.issues)
+    return failures
+
+
+def main(argv=None) -> int:
+    args = sys.argv[1:] if argv is None else argv
+
+    if not args:
+        print(USAGE, file=sys.stderr)
+        return 2
+    if args[0] in ('-h', '--help'):
+        print(USAGE)
+        return 0
+
+    mode = args[0]
+    if mode == '--differential':
+        import differential_harness
+        return differential_harness.main(args[1:])
+    if mode in ('--tests', '--comprehensive', '--real-world'):
+        import grammar_vigorous_test
+        runner = grammar_vigorous_test.GrammarTestRunner()
+        if mode == '--comprehensive':
+            runner.run_comprehensive_testing()
+        elif mode == '--real-world':
+            runner.run_real_world_tests(*args[1:2])
+        else:
+            runner.run_all_tests()
+        return 0
+
+    from ll1_core import PDFCompliantLexer, LL1Parser, SemanticChecker, save_precompiled_grammar
+
+    if mode == '--compile':
+        if not save_precompiled_grammar(LL1Parser().compiled):
+            print("ll1_validate: could not write the precompiled parsing table", file=sys.stderr)
+            return 2
+        return 0
+
+    semantic = mode == '--semantic'
+    paths = args[1:] if semantic else args
+    if not paths:
+        print(USAGE, file=sys.stderr)
+        return 2
+
+    lexer = PDFCompliantLexer()
+    parser = LL1Parser.precompiled()
+    failures = 0
+    for path in paths:
+        # One checker per file: stored variables and RES history follow the file's line order
+        checker = SemanticChecker() if semantic else None
+        try:
+            if path == '-':
+                failures += validate_lines(sys.stdin, '<stdin>', lexer, parser, checker)
+            else:
+                with open(path, 'r', encoding='utf-8') as f:
+                    failures += validate_lines(f, path, lexer, parser, checker)
+        except OSError as e:
+            print(f"ll1_validate: {path}: {e.strerror}", file=sys.stderr)
+            return 2
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Parse Table Statistics and Compression
+Report LL(1) table density, FIRST/FOLLOW sizes and production lengths, and emit a compressed table
+
+The sparse (non_terminal, terminal) -> production dict built by LL1Parser is packed into a
+row-displacement (comb-vector) encoding over the compiled symbol IDs:
+
+    entry = value[base[row] + terminal]  if check[base[row] + terminal] == row  else default[row]
+
+With defaults enabled, each non-terminal's most frequent production becomes its row default and
+is dropped from the comb, in the style of LR default reductions. Accept/reject behavior is
+unchanged: a default taken on a lookahead the row had no entry for consumes no input before the
+mismatch is detected a few expansions later. CompressedTableParser parses directly from this
+encoding; on error it traces back to the first row whose default was taken without the lookahead
+being valid there, so its diagnostics match LL1Parser's.
+
+Usage:
+    python table_stats.py                              # statistics for the built-in grammar
+    python table_stats.py --spec Corrected_LL1_Grammar_Documentation.md
+    python table_stats.py --emit table.marshal [--no-defaults]
+"""
+
+import sys
+import marshal
+import argparse
+from typing import List, Dict, Tuple, Optional
+
+from ll1_core import (
+    LL1Parser, CompiledGrammar, ParseLimits, Token, TokenType, SemanticChecker,
+    format_syntax_error, format_limit_error, expected_one_of,
+)
+
+COMPRESSED_TABLE_FORMAT = 2
+
+
+class CompressedTable:
+    """Row-displacement encoding of an LL(1) parsing table over integer symbol IDs"""
+    __slots__ = ('grammar_hash', 'start_symbol', 'symbols', 'terminal_count', 'productions',
+                 'base', 'check', 'value', 'default', 'expected_terminals')
+
+    def __init__(self, grammar_hash: str, start_symbol: str, symbols: List[str], terminal_count: int,
+                 productions: List[Tuple[int, Tuple[int, ...]]], base: List[int], check: List[int],
+                 value: List[int], default: List[int], expected_terminals: Dict[str, Tuple[str, ...]]):
+        self.grammar_hash = grammar_hash
+        self.start_symbol = start_symbol
+        self.symbols = symbols                  # symbol ID -> name; terminals first
+        self.terminal_count = terminal_count    # IDs below this are terminals, the rest are rows
+        self.productions = productions          # production ID -> (lhs ID, rhs IDs); empty rhs is ε
+        self.base = base                        # row -> displacement into check/value
+        self.check = check                      # owning row of each comb slot, -1 when free
+        self.value = value                      # production ID of each comb slot
+        self.default = default                  # row -> default production ID, -1 for none
+        self.expected_terminals = expected_terminals    # non-terminal -> sorted terminals, for error messages
+
+    def lookup(self, row: int, terminal: int) -> int:
+        """Production ID for (row, terminal), or -1 for a syntax error"""
+        index = self.base[row] + terminal
+        if index < len(self.check) and self.check[index] == row:
+            return self.value[index]
+        return self.default[row]
+
+    def size(self) -> int:
+        """Number of integer cells in the encoding"""
+        return len(self.base) + len(self.check) + len(self.value) + len(self.default)
+
+    def to_dict(self) -> dict:
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data['format'] = COMPRESSED_TABLE_FORMAT
+        return data
+
+    def save(self, path: str):
+        with open(path, 'wb') as f:
+            marshal.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path: str) -> 'CompressedTable':
+        with open(path, 'rb') as f:
+            data = marshal.load(f)
+        if data.pop('format', None) != COMPRESSED_TABLE_FORMAT:
+            raise ValueError(f"{path}: unsupported compressed table format")
+        return cls(**data)
+
+
+def compress_table(compiled: CompiledGrammar, use_defaults: bool = True) -> CompressedTable:
+    """Pack a compiled parsing table with row displacement and optional per-row defaults"""
+    symbol_ids = compiled.symbol_ids
+    symbols = sorted(symbol_ids, key=symbol_ids.get)
+    non_terminals = list(compiled.grammar)
+    terminal_count = len(symbols) - len(non_terminals)
+
+    # Productions in grammar order; ε becomes an empty right-hand side
+    productions = []
+    production_ids = {}
+    for non_terminal in non_terminals:
+        for production in compiled.grammar[non_terminal]:
+            rhs = () if production == ['EPSILON'] else tuple(symbol_ids[symbol] for symbol in production)
+            production_ids.setdefault((non_terminal, tuple(production)), len(productions))
+            productions.append((symbol_ids[non_terminal], rhs))
+
+    rows: List[Dict[int, int]] = [{} for _ in non_terminals]
+    for (non_terminal, terminal), production in compiled.parsing_table.items():
+        row = symbol_ids[non_terminal] - terminal_count
+        rows[row][symbol_ids[terminal]] = production_ids[(non_terminal, tuple(production))]
+
+    default = [-1] * len(rows)
+    if use_defaults:
+        for row, entries in enumerate(rows):
+            if entries:
+                counts: Dict[int, int] = {}
+                for production_id in entries.values():
+                    counts[production_id] = counts.get(production_id, 0) + 1
+                default[row] = max(counts, key=lambda production_id: (counts[production_id], -production_id))
+                rows[row] = {t: p for t, p in entries.items() if p != default[row]}
+
+    # First-fit row displacement, densest rows first
+    base = [0] * len(rows)
+    check: List[int] = []
+    value: List[int] = []
+    for row in sorted(range(len(rows)), key=lambda r: len(rows[r]), reverse=True):
+        columns = rows[row]
+        if not columns:
+            continue
+        offset = 0
+        while any(offset + t < len(check) and check[offset + t] != -1 for t in columns):
+            offset += 1
+        needed = offset + max(columns) + 1
+        if needed > len(check):
+            check.extend([-1] * (needed - len(check)))
+            value.extend([-1] * (needed - len(value)))
+        for terminal, production_id in columns.items():
+            check[offset + terminal] = row
+            value[offset + terminal] = production_id
+        base[row] = offset
+
+    return CompressedTable(compiled.grammar_hash, compiled.start_symbol, symbols, terminal_count,
+                           productions, base, check, value, default, dict(compiled.expected_terminals))
+
+
+class CompressedTableParser:
+    """
+    LL(1) parser driven directly by a CompressedTable; same parse() contract as LL1Parser
+    Verdicts, error messages and successful derivations match LL1Parser; a failed parse's partial
+    derivation may also list the row-default expansions taken before the error was detected
+    """
+
+    def __init__(self, table: Optional[CompressedTable] = None, limits: Optional[ParseLimits] = None):
+        if table is None:
+            table = compress_table(LL1Parser.precompiled().compiled)
+        self.table = table
+        self.limits = limits if limits is not None else ParseLimits()
+        self.start_symbol = table.start_symbol
+        self.expected_terminals = table.expected_terminals
+        self.expected_sets = {name: frozenset(terminals) for name, terminals in table.expected_terminals.items()}
+        self.terminal_ids = {name: symbol_id for symbol_id, name in enumerate(table.symbols[:table.terminal_count])}
+        self.fim_id = self.terminal_ids[TokenType.FIM.value]
+        self.start_id = table.symbols.index(table.start_symbol)
+
+        # Right-hand sides pre-reversed for pushing, and derivation text per production
+        symbols = table.symbols
+        self.push_order = [tuple(reversed(rhs)) for _, rhs in table.productions]
+        self.derivation_text = [
+            f"{symbols[lhs]} → {' '.join(symbols[s] for s in rhs) if rhs else 'EPSILON'}"
+            for lhs, rhs in table.productions
+        ]
+
+    @classmethod
+    def load(cls, path: str, limits: Optional[ParseLimits] = None) -> 'CompressedTableParser':
+        return cls(CompressedTable.load(path), limits)
+
+    def _blamed_row(self, lookahead: str, defaulted: List[str]) -> Optional[str]:
+        """First defaulted row that had no entry for the lookahead; LL1Parser would have failed there"""
+        for non_terminal in defaulted:
+            if lookahead not in self.expected_sets[non_terminal]:
+                return non_terminal
+        return None
+
+    def _error(self, tokens: List[Token], index: int, lookahead: str, defaulted: List[str],
+               expected: str, context: str = "") -> str:
+        """Syntax error, attributed to the first defaulted row that had no entry for the lookahead"""
+        blamed = self._blamed_row(lookahead, defaulted)
+        if blamed is not None:
+            expected, context = expected_one_of(self.expected_terminals[blamed]), blamed
+        return format_syntax_error(tokens, index, expected, context)
+
+    def parse(self, tokens: List[Token], checker: Optional[SemanticChecker] = None) -> Tuple[bool, List[str], str]:
+        """
+        Parse tokens using the compressed table
+        Matched terminals are fed to checker, if given, in the same pass
+        Returns: (success, derivation_sequence, error_message)
+        """
+        if checker is not None:
+            checker.begin(tokens)
+        table = self.table
+        symbols = table.symbols
+        terminal_count = table.terminal_count
+        terminal_ids = self.terminal_ids
+        base, check, value, default = table.base, table.check, table.value, table.default
+        comb_size = len(check)
+        try:
+            input_ids = [terminal_ids[token.type.value] for token in tokens]
+            input_ids.append(self.fim_id)
+            stack = [self.fim_id, self.start_id]
+            input_index = 0
+            derivation = []
+            defaulted = []  # Rows whose default was taken since the last match
+            max_depth = self.limits.max_stack_depth
+            if max_depth is None:
+                max_depth = float('inf')
+
+            while len(stack) > 1:
+                top = stack[-1]
+                current = input_ids[input_index]
+
+                if top == current:
+                    stack.pop()
+                    if checker is not None:
+                        try:
+                            checker.match(tokens[input_index])
+                        except Exception as e:
+                            # A pre-check fault must never change the parse verdict; the checker
+                            # ignores the rest of this input and its issue is kept only on success
+                            checker.abort(tokens[input_index], e)
+                    input_index += 1
+                    derivation.append(f"Match terminal: {symbols[top]}")
+                    if defaulted:
+                        defaulted = []
+                elif top >= terminal_count:
+                    row = top - terminal_count
+                    index = base[row] + current
+                    if index < comb_size and check[index] == row:
+                        production_id = value[index]
+                    else:
+                        production_id = default[row]
+                        if production_id < 0:
+                            expected = expected_one_of(self.expected_terminals[symbols[top]])
+                            return False, derivation, self._error(tokens, input_index, symbols[current], defaulted,
+                                                                  expected, symbols[top])
+                        defaulted.append(symbols[top])
+                    stack.pop()
+                    stack.extend(self.push_order[production_id])
+                    if len(stack) > max_depth:
+                        # Expansions after a default taken on a lookahead its row lacks only delay the
+                        # syntax error; LL1Parser stops there, before the stack could grow past the limit
+                        blamed = self._blamed_row(symbols[current], defaulted) if defaulted else None
+                        if blamed is not None:
+                            expected = expected_one_of(self.expected_terminals[blamed])
+                            return False, derivation, format_syntax_error(tokens, input_index, expected, blamed)
+                        return False, derivation, format_limit_error(tokens, input_index, len(stack), self.limits)
+                    derivation.append(self.derivation_text[production_id])
+                else:
+                    return False, derivation, self._error(tokens, input_index, symbols[current], defaulted,
+                                                          symbols[top])
+
+            if input_index < len(tokens) - 1:  # -1 for FIM token
+                return False, derivation, self._error(tokens, input_index, symbols[input_ids[input_index]],
+                                                      defaulted, "end of input")
+
+            if checker is not None:
+                checker.commit()
+            return True, derivation, "Parse successful"
+
+        except Exception as e:
+            return False, [], f"Parse error: {type(e).__name__}: {str(e)}"
+
+
+def grammar_statistics(parser: LL1Parser) -> dict:
+    """Table density, per non-terminal entries and conflicts, FIRST/FOLLOW sizes, production lengths"""
+    first_sets = parser._calculate_first_sets()
+    follow_sets = parser._calculate_follow_sets(first_sets)
+    terminals = parser._terminals()
+    non_terminals = list(parser.grammar)
+
+    entries = {non_terminal: 0 for non_terminal in non_terminals}
+    for non_terminal, _ in parser.parsing_table:
+        entries[non_terminal] += 1
+
+    # Predict sets per production; overlapping ones are LL(1) conflicts the table resolved by last-write
+    conflicts = {}
+    for non_terminal in non_terminals:
+        seen: Dict[str, int] = {}
+        for production in parser.grammar[non_terminal]:
+            predict = set()
+            for symbol in production:
+                predict |= first_sets[symbol] - {'EPSILON'}
+                if 'EPSILON' not in first_sets[symbol]:
+                    break
+            else:
+                predict |= follow_sets[non_terminal]
+            for terminal in predict:
+                seen[terminal] = seen.get(terminal, 0) + 1
+        conflicts[non_terminal] = sorted(t for t, count in seen.items() if count > 1)
+
+    lengths = [0 if p == ['EPSILON'] else len(p) for productions in parser.grammar.values() for p in productions]
+    cells = len(terminals) * len(non_terminals)
+    return {
+        'terminals': len(terminals),
+        'non_terminals': len(non_terminals),
+        'productions': len(lengths),
+        'table_entries': len(parser.parsing_table),
+        'table_cells': cells,
+        'density': len(parser.parsing_table) / cells if cells else 0.0,
+        'entries_per_non_terminal': entries,
+        'conflicts': {nt: terms for nt, terms in conflicts.items() if terms},
+        'first_sizes': {nt: len(first_sets[nt] - {'EPSILON'}) for nt in non_terminals},
+        'follow_sizes': {nt: len(follow_sets[nt]) for nt in non_terminals},
+        'nullable': [nt for nt in non_terminals if 'EPSILON' in first_sets[nt]],
+        'production_lengths': {
+            'min': min(lengths), 'max': max(lengths), 'mean': sum(lengths) / len(lengths),
+            'histogram': {length: lengths.count(length) for length in sorted(set(lengths))},
+        },
+    }
+
+
+def print_statistics(stats: dict, compressed: CompressedTable):
+    print("\n" + "=" * 80)
+    print("📐 PARSE TABLE STATISTICS")
+    print("=" * 80)
+    print(f"\n📊 GRAMMAR:")
+    print(f"   Terminals: {stats['terminals']}")
+    print(f"   Non-terminals: {stats['non_terminals']}")
+    print(f"   Productions: {stats['productions']}")
+    lengths = stats['production_lengths']
+    print(f"   Production length: min {lengths['min']}, max {lengths['max']}, mean {lengths['mean']:.2f}")
+    print(f"   Length histogram: {', '.join(f'{k}: {v}' for k, v in lengths['histogram'].items())}")
+    print(f"   Nullable: {', '.join(stats['nullable']) or '-'}")
+
+    print(f"\n📋 TABLE:")
+    print(f"   Entries: {stats['table_entries']} of {stats['table_cells']} cells ({stats['density'] * 100:.1f}% dense)")
+    print(f"   {'Non-terminal':<16}{'Entries':>8}{'FIRST':>8}{'FOLLOW':>8}  Conflicts")
+    for nt, count in stats['entries_per_non_terminal'].items():
+        conflicts = ', '.join(stats['conflicts'].get(nt, [])) or '-'
+        print(f"   {nt:<16}{count:>8}{stats['first_sizes'][nt]:>8}{stats['follow_sizes'][nt]:>8}  {conflicts}")
+
+    print(f"\n🗜️  COMPRESSED ENCODING:")
+    defaults = sum(1 for d in compressed.default if d >= 0)
+    print(f"   Row defaults: {defaults}/{len(compressed.default)} non-terminals")
+    print(f"   Comb vector: {len(compressed.check)} slots, {sum(1 for c in compressed.check if c >= 0)} used")
+    print(f"   Encoding size: {compressed.size()} cells vs {stats['table_cells']} for a dense table")
+    print("=" * 80)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Parse-table statistics and compressed table exporter")
+    parser.add_argument('--spec', help="Markdown grammar spec to analyze (default: built-in grammar)")
+    parser.add_argument('--emit', help="Write the compressed table to this file")
+    parser.add_argument('--no-defaults', action='store_true', help="Do not use per-row default productions")
+    args = parser.parse_args(argv)
+
+    ll1_parser = LL1Parser.from_spec(args.spec) if args.spec else LL1Parser()
+    compressed = compress_table(ll1_parser.compiled, not args.no_defaults)
+    print_statistics(grammar_statistics(ll1_parser), compressed)
+    if args.emit:
+        compressed.save(args.emit)
+        print(f"💾 Compressed table written to {args.emit}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())